@@ -126,7 +126,6 @@ class ValueSource(Mapping):
 class ValueProperty(Generic[_T]):
     _name: str | None
     _srcs: dict[str, str]
-    _val: Any | MissingType
     _default: Any | None
     _cast: Callable | None
     _required: bool
@@ -145,7 +144,6 @@ class ValueProperty(Generic[_T]):
         self._cast = cast
         self._required = required
         self._pub_name = public
-        self._val = MISSING
         for k, v in kwargs.items():
             if k.endswith('_src'):
                 self._srcs[k[:-4]] = v
@@ -163,29 +161,47 @@ class ValueProperty(Generic[_T]):
         if self._pub_name is True:
             self._pub_name = name
     def __get__(self, obj: Any, owner = None):
-        if self._val is MISSING:
-            v = MISSING
-            for srckey, src in self._srcs.items():
-                if (getter := self._getter(obj, srckey)):
-                    v = getter.get(src, v)
-                    if _not_missing(v):
-                        if srckey != 'default':
-                            logger.info(f'value {self._name} found in {srckey} source')
-                        break
-            if not _not_missing(v):
-                if self._required:
-                    raise self._not_found(f'required config {self._srcs['default']} not set!')
-                else:
-                    v = self._default
-            if callable(self._cast):
-                v = self._cast(v) if v is not None else self._cast()
-            self._val = v
-        return self._val
+        if obj is None:
+            return self
+        cache = self._cache_for(obj)
+        try:
+            return cache[self._name]
+        except KeyError:
+            pass
+        v = MISSING
+        for srckey, src in self._srcs.items():
+            if (getter := self._getter(obj, srckey)):
+                v = getter.get(src, v)
+                if _not_missing(v):
+                    if srckey != 'default':
+                        logger.info(f'value {self._name} found in {srckey} source')
+                    break
+        if not _not_missing(v):
+            if self._required:
+                raise self._not_found(f'required config {self._srcs['default']} not set!')
+            else:
+                v = self._default
+        if callable(self._cast):
+            v = self._cast(v) if v is not None else self._cast()
+        cache[self._name] = v
+        return v
 
     @abstractmethod
     def _getter(self, obj: Any, name: str = 'default') -> ValueSource:
         pass
 
+    def _cache_for(self, obj: Any) -> dict[str, Any]:
+        """
+        Where resolved values of obj are memoized, keyed by property name.
+
+        By default nothing is memoized (a fresh dict is returned every time);
+        subclasses opt in by returning a dict owned by obj, and are in charge
+        of invalidating it.
+
+        *New in 0.14.0*
+        """
+        return {}
+
     @property
     def name(self):
         return self._name
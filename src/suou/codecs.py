@@ -25,6 +25,15 @@ from typing import Any, Callable
 from .bits import mod_ceil, split_bits, join_bits
 from .functools import deprecated
 
+try:
+    import pybase64
+except ImportError:
+    # optional, SIMD accelerated drop-in for the base64 functions below
+    pybase64 = None
+
+_urlsafe_b64encode = pybase64.urlsafe_b64encode if pybase64 else base64.urlsafe_b64encode
+_urlsafe_b64decode = pybase64.urlsafe_b64decode if pybase64 else base64.urlsafe_b64decode
+
 # yes, I know ItsDangerous implements that as well, but remember
 # what happened with werkzeug.safe_str_cmp()? 
 # see also: https://gitlab.com/wcorrales/quart-csrf/-/issues/1
@@ -207,7 +216,7 @@ def b64encode(val: bytes, *, strip: bool = True) -> str:
     '''
     Wrapper around base64.urlsafe_b64encode() which also strips trailing '='.
     '''
-    b = want_str(base64.urlsafe_b64encode(val))
+    b = want_str(_urlsafe_b64encode(val))
     return b.rstrip('=') if strip else b
 
 def b64decode(val: bytes | str) -> bytes:
@@ -215,13 +224,23 @@ def b64decode(val: bytes | str) -> bytes:
     Wrapper around base64.urlsafe_b64decode() which deals with padding.
     '''
     val = want_urlsafe(val)
-    return base64.urlsafe_b64decode(val.ljust(mod_ceil(len(val), 4), '='))
+    return _urlsafe_b64decode(val.ljust(mod_ceil(len(val), 4), '='))
+
+def b64decode_lax(val: bytes) -> bytes:
+    '''
+    Faster b64decode() for bytes input. Missing or excess padding is tolerated,
+    and so are '+/' in place of '-_'.
+
+    *New in 0.14.0*
+    '''
+    # the decoder ignores padding past the end of data
+    return _urlsafe_b64decode(val + b'==')
 
 def rb64encode(val: bytes, *, strip: bool = True) -> str:
     '''
     Call base64.urlsafe_b64encode() with null bytes i.e. '\\0' padding to the start. Leading 'A' are stripped from result.
     '''
-    b = want_str(base64.urlsafe_b64encode(val.rjust(mod_ceil(len(val), 3), '\0')))
+    b = want_str(_urlsafe_b64encode(val.rjust(mod_ceil(len(val), 3), '\0')))
     return b.lstrip('A') if strip else b
 
 def rb64decode(val: bytes | str) -> bytes:
@@ -229,7 +248,7 @@ def rb64decode(val: bytes | str) -> bytes:
     Wrapper around base64.urlsafe_b64decode() which deals with padding.
     '''
     val = want_urlsafe(val)
-    return base64.urlsafe_b64decode(val.rjust(mod_ceil(len(val), 4), 'A'))
+    return _urlsafe_b64decode(val.rjust(mod_ceil(len(val), 4), 'A'))
 
 
 B85_TO_Z85 = str.maketrans(
@@ -374,5 +393,5 @@ class StringCase(enum.Enum):
 __all__ = (
     'cb32encode', 'cb32decode', 'b32lencode', 'b32ldecode', 'b64encode', 'b64decode', 'jsonencode'
     'StringCase', 'want_bytes', 'want_str', 'jsondecode', 'ssv_list', 'twocolon_list', 'want_urlsafe', 'want_urlsafe_bytes',
-    'z85encode', 'z85decode'
+    'z85encode', 'z85decode', 'b64decode_lax'
 )
\ No newline at end of file
@@ -19,9 +19,11 @@ from __future__ import annotations
 from ast import TypeVar
 from collections.abc import Mapping
 from configparser import ConfigParser as _ConfigParser
+from functools import lru_cache
 import os
 from typing import Any, Callable, Iterator, override
 from collections import OrderedDict
+from operator import attrgetter
 
 from argparse import Namespace
 
@@ -46,10 +48,11 @@ class EnvConfigSource(ConfigSource):
     '''
     Config source from os.environ aka .env
     '''
+    # what ConfigValue calls on every read: no Python wrapper frame in between
+    get = staticmethod(os.environ.get)
+
     def __getitem__(self, key: str, /) -> str:
         return os.environ[key]
-    def get(self, key: str, fallback = None, /):
-        return os.getenv(key, fallback)
     def __contains__(self, key: str, /) -> bool:
         return key in os.environ
     def __iter__(self) -> Iterator[str]:
@@ -58,6 +61,14 @@ class EnvConfigSource(ConfigSource):
         return len(os.environ)
 
 
+@lru_cache(maxsize=1024)
+def _split_key(key: str) -> tuple[str, str]:
+    """
+    'section.option' -> ('section', 'option'). Config keys are few and looked up often.
+    """
+    k1, _, k2 = key.partition('.')
+    return k1, k2
+
 class ConfigParserConfigSource(ConfigSource):
     '''
     Config source from ConfigParser
@@ -70,36 +81,36 @@ class ConfigParserConfigSource(ConfigSource):
            raise TypeError(f'a ConfigParser object is required (got {cfp.__class__.__name__!r})')
         self._cfp = cfp
     def __getitem__(self, key: str, /) -> str:
-        k1, _, k2 = key.partition('.')
+        k1, k2 = _split_key(key)
         return self._cfp.get(k1, k2)
     def get(self, key: str, fallback = None, /):
-        k1, _, k2 = key.partition('.')
+        k1, k2 = _split_key(key)
         return self._cfp.get(k1, k2, fallback=fallback)
     def __contains__(self, key: str, /) -> bool:
-        k1, _, k2 = key.partition('.')
+        k1, k2 = _split_key(key)
         return self._cfp.has_option(k1, k2)
     def __iter__(self) -> Iterator[str]:
         for k1, v1 in self._cfp.items():
             for k2 in v1:
                 yield f'{k1}.{k2}'
     def __len__(self) -> int:
-        ## XXX might be incorrect but who cares
-        return sum(len(x) for x in self._cfp)
+        # iterating a ConfigParser yields section names: count the options instead
+        return sum(len(v1) for v1 in self._cfp.values())
 
 class DictConfigSource(ConfigSource):
     '''
     Config source from Python mappings. Useful with JSON/TOML config
     '''
-    __slots__ = ('_d',)
+    __slots__ = ('_d', 'get')
 
     _d: dict[str, Any]
 
     def __init__(self, mapping: dict[str, Any]):
         self._d = mapping
+        # the mapping is wrapped, not copied: bind its own .get(), which ConfigValue calls on every read
+        self.get = mapping.get
     def __getitem__(self, key: str, /) -> str:
         return self._d[key]
-    def get(self, key: str, fallback: _T = None, /):
-        return self._d.get(key, fallback)
     def __contains__(self, key: str, /) -> bool:
         return key in self._d
     def __iter__(self) -> Iterator[str]:
@@ -173,9 +184,7 @@ class ConfigValue(ValueProperty):
         src_name = name if self._preserve_case else name.upper()
 
         super().__set_name__(owner, name, src_name=src_name)
-
-        if self._pub_name and isinstance(owner, ConfigOptions):
-            owner.expose(self._pub_name, name)
+        # public values are collected by ConfigOptions.__init_subclass__()
         
 
     @override
@@ -184,6 +193,10 @@ class ConfigValue(ValueProperty):
             raise RuntimeError('attempt to get config value with no source configured')
         return obj._srcs.get(name)
 
+    @override
+    def _cache_for(self, obj: ConfigOptions) -> dict[str, Any]:
+        return obj._cache
+
 
 class ConfigOptions:
     """
@@ -193,23 +206,58 @@ class ConfigOptions:
     ConfigValue() properties.
 
     Further config sources can be added with .add_source()
+
+    *Changed in 0.14.0*: values are resolved once per instance, then
+    memoized until .invalidate() or .add_source() is called;
+    public=... values are actually exposed
     """
 
-    __slots__ = ('_srcs', '_pub')
+    __slots__ = ('_srcs', '_pub', '_cache')
 
     _srcs: OrderedDict[str, ConfigSource]
     _pub: dict[str, str]
+    _cache: dict[str, Any]
+    # public values known at class creation, and a getter for all of them at once
+    _class_pub: dict[str, str] = {}
+    _class_pub_getter: Callable[[ConfigOptions], tuple] | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        pub = dict()
+        for klass in reversed(cls.__mro__):
+            for name, v in vars(klass).items():
+                if isinstance(v, ConfigValue) and v._pub_name:
+                    pub[v._pub_name] = name
+        cls._class_pub = pub
+        # attrgetter() returns a bare value, not a tuple, for a single name
+        cls._class_pub_getter = attrgetter(*pub.values()) if len(pub) > 1 else None
 
     def __init__(self, /):
         self._srcs = OrderedDict(
             default = EnvConfigSource()
         )
-        self._pub = dict()
+        self._pub = dict(self._class_pub)
+        self._cache = dict()
 
     def add_source(self, key: str, csrc: ConfigSource, /, *, first: bool = False):
         self._srcs[key] = csrc
         if first:
             self._srcs.move_to_end(key, False)
+        # a new source may shadow values already read
+        self._cache.clear()
+
+    def invalidate(self, name: str | None = None, /) -> None:
+        '''
+        Forget memoized config values, i.e. have them read again from sources.
+
+        If name is given, only that value is forgotten.
+
+        *New in 0.14.0*
+        '''
+        if name is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(name, None)
 
     add_config_source = deprecated('use add_source() instead')(add_source)
 
@@ -217,12 +265,15 @@ class ConfigOptions:
         '''
         Mark a config value as public.
 
-        Called automatically by ConfigValue.__set_name__().
+        ConfigValue()'s with public=... are exposed automatically.
         '''
         attr_name = attr_name or public_name
         self._pub[public_name] = attr_name
     
     def to_dict(self, /):
+        if self._class_pub_getter is not None and self._pub == self._class_pub:
+            # nothing exposed at runtime: fetch all values in one C call
+            return dict(zip(self._pub, self._class_pub_getter(self)))
         d = dict()
         for k, v in self._pub.items():
             d[k] = getattr(self, v)
@@ -43,17 +43,14 @@ def add_i18n(app: Flask, i18n: I18n, var_name: str = 'T', *,
     def _get_lang():
         lang = request.args.get(query_arg)
         if not lang:
-            for lp in request.headers.get('accept-language', 'en').split(','):
-                l = lp.split(';')[0]
-                lang = l
-                break
-            else:
-                lang = default_lang
+            # first preference only: stop splitting as soon as it is found
+            lang = request.headers.get('accept-language', 'en').split(',', 1)[0].split(';', 1)[0] or default_lang
         return lang
     
     @app.context_processor
     def _add_i18n():
-        return {var_name: i18n.lang(_get_lang()).t}
+        # g.lang is set before request, no need to parse headers again
+        return {var_name: i18n.lang(getattr(g, 'lang', None) or _get_lang()).t}
 
     @app.before_request
     def _add_language_code():
@@ -84,16 +81,24 @@ def harden(app: Flask):
     
     return app
 
+# MIME types for best_match(), which wants strings, not WantsContentType members
+_NEGOTIATE_FALLBACK = (WantsContentType.PLAIN.value, WantsContentType.JSON.value, WantsContentType.HTML.value)
+
 def negotiate() -> WantsContentType:
     """
     Return an appropriate MIME type for the sake of content negotiation.
     """
-    if any(request.path.startswith(f'/{p.strip('/')}/') for p in current_app.config.get('REST_PATHS', [])):
+    rest_prefixes = current_app.config.get('REST_PATHS_NORMALIZED')
+    if rest_prefixes is None:
+        rest_prefixes = tuple(f'/{p.strip('/')}/' for p in current_app.config.get('REST_PATHS', []))
+    if request.path.startswith(rest_prefixes):
         return WantsContentType.JSON
-    elif request.user_agent.string.startswith('Mozilla/'):
+    # the raw header is enough, no need to build a UserAgent
+    elif request.headers.get('User-Agent', '').startswith('Mozilla/'):
         return WantsContentType.HTML
     else:
-        return request.accept_mimetypes.best_match([WantsContentType.PLAIN, WantsContentType.JSON, WantsContentType.HTML])
+        best = request.accept_mimetypes.best_match(_NEGOTIATE_FALLBACK)
+        return WantsContentType(best) if best else None
 
 
 # Optional dependency: do not import into __init__.py
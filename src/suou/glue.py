@@ -19,10 +19,8 @@ from types import ModuleType
 
 from functools import wraps
 from suou.classtools import MISSING
-from suou.functools import future
 
 
-@future()
 class FakeModule(ModuleType):
     """
     Fake module used in @glue() in case of import error
@@ -34,34 +32,38 @@ class FakeModule(ModuleType):
         raise AttributeError(f'Module {self.__name__} not found; this feature is not available ({self._exc})') from self._exc
 
 
-@future()
 def glue(*modules):
     """
     Helper for "glue" code -- it imports the given modules and passes them as keyword arguments to the wrapped functions.
 
     EXPERIMENTAL
+
+    *Changed in 0.14.0*: no more wrapped in @future(); wrapped functions are left alone
+    if all imports succeed
     """
     module_dict = dict()
     imports_succeeded = True
 
     for module in modules:
         try:
+            # imported eagerly: a module that exists may still fail to import
             module_dict[module] = importlib.import_module(module)
         except Exception as e:
             imports_succeeded = False
             module_dict[module] = FakeModule(module, e)
     
     def decorator(func):
+        if imports_succeeded:
+            # nothing to catch, skip the extra frame
+            return func
+
         @wraps(func)
         def wrapper(*a, **k):
             try:
-                result = func(*a, **k)
+                return func(*a, **k)
             except Exception:
-                if not imports_succeeded:
-                    ## XXX return an iterable? A Fake****?
-                    return MISSING
-                raise
-            return result
+                ## XXX return an iterable? A Fake****?
+                return MISSING
         return wrapper
     return decorator
 
@@ -20,8 +20,9 @@ from __future__ import annotations
 from abc import ABCMeta, abstractmethod
 import json
 import os
-import toml
-from typing import Mapping
+from types import MappingProxyType
+from typing import Any, Mapping
+from weakref import WeakSet
 
 from .exceptions import BabelTowerError
 
@@ -35,25 +36,71 @@ class IdentityLang:
 class I18nLang:
     '''
     Single I18n language.
+
+    Strings from fallback languages are merged into a flat lookup table,
+    so that t() is a single dict lookup no matter how deep the fallback chain is.
+    The table is rebuilt by update() and add_fallback(), and changes to a
+    fallback language propagate to the languages depending on it.
+
+    *Changed in 0.14.0*: fallbacks are flattened
     '''
     _strings: dict[str, str]
     _fallback: I18nLang | IdentityLang
+    _effective: dict[str, str]
+    _terminal: IdentityLang
+    _dependents: WeakSet[I18nLang]
 
     def __init__(self, mapping: Mapping | None = None, /):
         self._strings = dict(mapping) if mapping else dict()
         self._fallback = IdentityLang()
+        self._dependents = WeakSet()
+        self._refresh()
+
+    def _refresh(self):
+        fb = self._fallback
+        if isinstance(fb, I18nLang):
+            self._effective = {**fb._effective, **self._strings}
+            # strings missing from the whole chain
+            self._terminal = fb._terminal
+        else:
+            self._effective = self._strings
+            self._terminal = fb
+        self._getitem = self._effective.__getitem__
+        for dep in list(self._dependents):
+            dep._refresh()
 
     def t(self, key: str, /, *args, **kwargs) -> str:
-        s = self._strings.get(key) or self._fallback.t(key)
+        try:
+            s = self._getitem(key)
+        except KeyError:
+            s = self._terminal.t(key)
+        # formatted every time: arguments may be equal yet format differently
         if args or kwargs:
             s = s.format(*args, **kwargs)
         return s
 
     def update(self, keys: dict[str, str], /):
         self._strings.update(keys)
+        self._refresh()
 
     def add_fallback(self, fb: I18nLang):
+        if isinstance(self._fallback, I18nLang):
+            self._fallback._dependents.discard(self)
         self._fallback = fb
+        if isinstance(fb, I18nLang):
+            fb._dependents.add(self)
+        self._refresh()
+
+
+def _freeze(data: Any) -> Any:
+    """
+    Read-only version of parsed file data: dicts become mapping proxies, lists tuples.
+    """
+    if isinstance(data, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in data.items()})
+    if isinstance(data, list):
+        return tuple(_freeze(v) for v in data)
+    return data
 
 
 class I18n(metaclass=ABCMeta):
@@ -70,14 +117,33 @@ class I18n(metaclass=ABCMeta):
     autoload: bool
     EXT: str
 
+    _file_cache: dict[str, tuple[int, Mapping]] = {}
+
     @classmethod
     @abstractmethod
     def loads(cls, s: str) -> dict:
         pass
 
-    def load_file(self, filename: str, *, root: str | None = None) -> dict:
-        with open(os.path.join(root or self.root, filename)) as f:
-            return self.loads(f.read())
+    def load_file(self, filename: str, *, root: str | None = None) -> Mapping:
+        '''
+        Read and parse a strings file.
+
+        Parsed files are cached (shared by all instances) until their mtime changes.
+        The result is shared too, hence read-only: copy it (i.e. with dict())
+        before making changes.
+
+        *Changed in 0.14.0*: parsed files are cached; returns a read-only mapping
+        '''
+        path = os.path.abspath(os.path.join(root or self.root, filename))
+        mtime = os.stat(path).st_mtime_ns
+        cached = self._file_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        with open(path) as f:
+            data = _freeze(self.loads(f.read()))
+        # one entry per path: stale versions get replaced
+        self._file_cache[path] = (mtime, data)
+        return data
 
     def load_lang(self, name: str, filename: str | None = None) -> I18nLang:
         if not filename:
@@ -120,7 +186,13 @@ class TomlI18n(I18n):
     EXT = 'toml'
     @classmethod
     def loads(cls, s: str) -> dict:
-        return toml.loads(s)
+        # imported lazily, JSON-only users don't need it
+        try:
+            import tomllib
+        except ImportError:
+            # Python 3.10
+            import tomli as tomllib
+        return tomllib.loads(s)
 
 
 __all__ = ('I18n', 'JsonI18n', 'TomlI18n')
\ No newline at end of file
@@ -30,22 +30,26 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 
 from __future__ import annotations
 import base64
-import binascii
+from collections import deque
 import datetime
 import enum
-from functools import cached_property
+from functools import lru_cache
 import hashlib
 from threading import Lock
 import time
 import os
-from typing import Iterable, override
+from typing import Callable, Iterable, override
 import warnings
+import zlib
 
 from suou.calendar import want_timestamp
 
 from .functools import deprecated
 from .codecs import b32lencode, b64encode, cb32decode, cb32encode, want_str
 
+_SHIFT16 = 1 << 16
+_MASK16 = 0xFFFF
+_MASK32 = 0xFFFFFFFF
 
 class SiqType(enum.Enum):
     """
@@ -91,18 +95,20 @@ class SiqType(enum.Enum):
 
     # - helpers -
     value: int
-    @cached_property
+    @property
     def n_bits(self) -> int:
-        val, lsh = self.value, 0
-        while val > 1:
-            val, lsh = val >> 1, lsh + 1
-        return lsh
+        return _SIQ_NBITS[self]
     def prepend(self, other: int) -> int:
-        return (other << self.n_bits) | (self.value % (1 << self.n_bits))
+        return (other << _SIQ_NBITS[self]) | (self.value & _SIQ_MASK[self])
     @classmethod
     def from_str(cls, value) -> SiqType:
         return cls(int(value))
 
+# qualifier values are constant, hence compute their widths once
+_SIQ_NBITS: dict[SiqType, int] = {m: m.value.bit_length() - 1 for m in SiqType}
+_SIQ_MASK: dict[SiqType, int] = {m: (1 << nb) - 1 for m, nb in _SIQ_NBITS.items()}
+
+@lru_cache(maxsize=128)
 def make_domain_hash(domain: str, local_id: int | None = None) -> int:
     """
     Compute a domain hash for SIQ.
@@ -110,6 +116,8 @@ def make_domain_hash(domain: str, local_id: int | None = None) -> int:
     the leading byte with the passed value.
     Note: local_id must be nonzero and it may replace only exactly 8 bits.
     To get all of them zeroed out, pass a local_id of 256.
+
+    *Changed in 0.14.0*: results are cached
     """
     if not domain or domain == '0':
         return 0
@@ -123,24 +131,29 @@ class SiqGen:
     """
     Implement a SIS-compliant SIQ generator.
     """
-    __slots__ = ('domain_hash', 'last_gen_ts', 'counters', 'shard_id', '_test_cur_ts', '__weakref__')
+    __slots__ = ('domain_hash', 'last_gen_ts', 'counters', 'shard_id', '_test_cur_ts', '_lock', '_prefix', '__weakref__')
 
     domain_hash: int
     last_gen_ts: int
     shard_id: int
     counters: dict[SiqType, int]
     _test_cur_timestamp: int | None
+    _lock: Lock
+    _prefix: int
 
     def __init__(self, domain: str, last_siq: int = 0, local_id: int | None = None, shard_id: int | None = None):
         self.domain_hash = make_domain_hash(domain, local_id)
+        self._lock = Lock()
         self._test_cur_ts = None ## test only
         self.last_gen_ts = min(last_siq >> 56, self.cur_timestamp())
         self.counters = dict()
         self.shard_id = (shard_id or os.getpid()) % 256
-    def cur_timestamp(self) -> int:
+        # shard and domain bits never change after init
+        self._prefix = ((self.shard_id & 0xFF) << 48) | ((self.domain_hash & _MASK32) << 16)
+    def cur_timestamp(self, _time=time.time) -> int:
         if self._test_cur_ts is not None:
             return self._test_cur_ts
-        return int(time.time() * (1 << 16))
+        return int(_time() * _SHIFT16)
     def set_cur_timestamp(self, value: datetime.datetime):
         """
         Intended to be used by tests only! Do not use in production!
@@ -161,24 +174,20 @@ class SiqGen:
         """
         now = self.cur_timestamp()
         if now < self.last_gen_ts:
-            time.sleep((self.last_gen_ts - now) / (1 << 16))
+            time.sleep((self.last_gen_ts - now) / _SHIFT16)
         elif now > self.last_gen_ts:
             self.counters[typ] = 0
+        counter_mod = 1 << (16 - typ.n_bits)
         while n:
             idseq = typ.prepend(self.counters.setdefault(typ, 0))
-            if idseq >= (1 << 16):
+            if idseq >= _SHIFT16:
                 while (now := self.cur_timestamp()) <= self.last_gen_ts:
-                    time.sleep(1 / (1 << 16))
-                with Lock():
-                    self.counters[typ] %= 1 << (16 - typ.n_bits) 
+                    time.sleep(1 / _SHIFT16)
+                with self._lock:
+                    self.counters[typ] %= counter_mod
             # XXX the lock is here "just in case", MULTITHREADED GENERATION IS NOT ADVISED!
-            with Lock():
-                siq = (
-                    (now << 56) | 
-                    ((self.shard_id % 256) << 48) |
-                    ((self.domain_hash % (1 << 32)) << 16) |
-                    (idseq % (1 << 16))
-                ) 
+            with self._lock:
+                siq = (now << 56) | self._prefix | (idseq & _MASK16)
                 n -= 1
                 self.counters[typ] += 1
             yield siq
@@ -191,8 +200,29 @@ class SiqGen:
         """
         Syntactic sugar for list(.generate()).
         Return the generated SIQ's as a list.
+
+        *Changed in 0.14.0*: bulk requests skip the per-ID generator loop
         """
+        if n > 4:
+            return self._generate_bulk(typ, n)
         return list(self.generate(typ, n))
+    def _generate_bulk(self, /, typ: SiqType, n: int) -> list[int]:
+        """
+        Same as list(.generate()), but builds the whole batch at once
+        as long as the counter does not wrap around within it.
+        """
+        now = self.cur_timestamp()
+        start = 0 if now > self.last_gen_ts else self.counters.get(typ, 0)
+        if start + n > 1 << (16 - typ.n_bits):
+            # counter would overflow mid-batch, let generate() wait for the next tick
+            return list(self.generate(typ, n))
+        if now < self.last_gen_ts:
+            time.sleep((self.last_gen_ts - now) / _SHIFT16)
+        nb = typ.n_bits
+        base = (now << 56) | self._prefix | (typ.value & _SIQ_MASK[typ])
+        with self._lock:
+            self.counters[typ] = start + n
+        return [base | (c << nb) for c in range(start, start + n)]
 
 class SiqFormatType(enum.Enum):
     BASE64 = 'b'
@@ -213,7 +243,7 @@ class SiqCache:
     typ: SiqType
     size: int
     max_age: int
-    _cache: list[int]
+    _cache: deque[int]
     @property
     def last_gen_ts(self) -> int:
         return self.generator.last_gen_ts
@@ -226,13 +256,46 @@ class SiqCache:
         self.typ = typ
         self.size = size
         self.max_age = max_age
-        self._cache = []
+        self._cache = deque()
     def generate(self) -> int:
         if self.last_gen_ts + self.max_age < self.cur_timestamp():
             self._cache.clear()
         if len(self._cache) == 0:
-            self._cache.extend(self.generator.generate(self.typ, self.size))
-        return self._cache.pop(0)
+            self._cache.extend(self.generator.generate_list(self.typ, self.size))
+        return self._cache.popleft()
+
+## Fixed-size base32 codecs working directly on ints, 10 bits (two digits) at a time.
+## SIQ's fit in 112 bits, so there is no need to go through bytes and base64.b32*().
+_B32L_ALPHABET = 'abcdefghijklmnopqrstuvwxyz234567'
+_CB32_ALPHABET = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'
+_B32L_PAIRS = tuple(a + b for a in _B32L_ALPHABET for b in _B32L_ALPHABET)
+_CB32_PAIRS = tuple(a + b for a in _CB32_ALPHABET for b in _CB32_ALPHABET)
+_INT32_DIGITS = '0123456789abcdefghijklmnopqrstuv'
+# map to digits understood by int(x, 32); anything outside the alphabet becomes 'z', i.e. invalid
+_B32L_TO_INT32 = str.maketrans(
+    _B32L_ALPHABET + _B32L_ALPHABET.upper() + '0189',
+    _INT32_DIGITS * 2 + 'zzzz')
+_CB32_TO_INT32 = str.maketrans(
+    _CB32_ALPHABET + _CB32_ALPHABET.lower() + 'ILOUilou',
+    _INT32_DIGITS * 2 + 'zzzzzzzz')
+
+def _b32_int_encode(n: int, nchars: int, pairs: tuple[str, ...]) -> str:
+    """
+    Encode a non-negative int into exactly nchars (must be even) base32 digits,
+    most significant first.
+    """
+    return ''.join([pairs[(n >> sh) & 0x3FF] for sh in range(5 * nchars - 10, -1, -10)])
+
+def _b32_int_decode(s: str, table: dict) -> int:
+    """
+    Decode base32 digits into an int, using a translation table to int(x, 32) digits.
+    """
+    t = s.translate(table)
+    # int() would accept signs, underscores and whitespace as well
+    if not (t.isascii() and t.isalnum()):
+        raise ValueError(f'invalid base32 string: {s!r}')
+    return int(t, 32)
+
 
 class Siq(int):
     """
@@ -251,11 +314,16 @@ class Siq(int):
         return b64encode(self.to_bytes(length), strip=strip)
     
     def to_cb32(self) -> str:
+        if 0 <= self < 1 << 120:
+            return _b32_int_encode(self, 24, _CB32_PAIRS).lstrip('0')
         return cb32encode(self.to_bytes(15, 'big')).lstrip('0')
     to_crockford = to_cb32
     @classmethod
     def from_cb32(cls, val: str | bytes):
-        return cls.from_bytes(cb32decode(want_str(val).zfill(24)))
+        val = want_str(val)
+        if len(val) <= 24:
+            return cls(_b32_int_decode(val or '0', _CB32_TO_INT32))
+        return cls.from_bytes(cb32decode(val.zfill(24)))
     
     def to_hex(self) -> str:
         return f'{self:x}'
@@ -267,6 +335,8 @@ class Siq(int):
         """
         This is NOT the URI serializer!
         """
+        if 0 <= self < 1 << 120:
+            return _b32_int_encode(self, 24, _B32L_PAIRS)
         return b32lencode(self.to_bytes(15, 'big'))
     def __str__(self) -> str:
         return int.__str__(self)
@@ -274,41 +344,54 @@ class Siq(int):
     
     @override
     def __format__(self, opt: str, /) -> str:
-        try:
-            return self.format(opt)
-        except ValueError:
-            return super().__format__(opt)
+        fn = self._FORMATTERS.get(opt)
+        if fn is not None:
+            try:
+                return fn(self)
+            except ValueError:
+                pass
+        return super().__format__(opt)
     def format(self, opt: str, /) -> str:
-        match opt:
-            case 'b':
-                return self.to_base64()
-            case 'c':
-                return self.to_cb32()
-            case '0c':
-                return '0' + self.to_cb32()
-            case 'd' | '':
-                return int.__repr__(self)
-            case 'l':
-                return self.to_b32l()
-            case 'o' | 'x':
-                return int.__format__(self, opt)
-            case 'u':
-                b = self.to_bytes()
-                cs = binascii.crc32(b).to_bytes(6, 'big', signed=False)
-                return b32lencode(cs + b)[3:]
-            case _:
-                raise ValueError(f'unknown format: {opt!r}')
+        try:
+            fn = self._FORMATTERS[opt]
+        except KeyError:
+            raise ValueError(f'unknown format: {opt!r}') from None
+        return fn(self)
+    def _format_did(self) -> str:
+        # 6 bytes checksum + 14 bytes SIQ, minus the three leading zero digits
+        cs = zlib.crc32(self.to_bytes())
+        return _b32_int_encode((cs << 112) | self, 30, _B32L_PAIRS)[1:]
+
+    # option -> formatter, used by format() and __format__()
+    _FORMATTERS: dict[str, Callable[[Siq], str]] = {
+        'b': to_base64,
+        'c': to_cb32,
+        '0c': lambda self: '0' + self.to_cb32(),
+        'd': int.__repr__,
+        '': int.__repr__,
+        'l': to_b32l,
+        'o': lambda self: int.__format__(self, 'o'),
+        'x': lambda self: int.__format__(self, 'x'),
+        'u': _format_did,
+    }
 
     def to_did(self) -> str:
-        return f'did:siq:{self:u}'
+        return 'did:siq:' + self._format_did()
     did = to_did
     uri = deprecated('use .did() instead')(did)
     to_uri = deprecated('shortened to .did()')(did)
     @classmethod
     def from_did(cls, did: str, /) -> Siq:
-        b = base64.b32decode('AAA' + did.removeprefix('did:siq:').upper())
+        did = did.removeprefix('did:siq:')
+        if len(did) == 29:
+            n = _b32_int_decode(did, _B32L_TO_INT32)
+            cs, n = n >> 112, n & ((1 << 112) - 1)
+            if zlib.crc32(n.to_bytes(14, 'big')) != cs:
+                raise ValueError('checksum mismatch')
+            return cls(n)
+        b = base64.b32decode('AAA' + did.upper())
         cs, b = int.from_bytes(b[:6], 'big'), b[6:]
-        if binascii.crc32(b) != cs:
+        if zlib.crc32(b) != cs:
             raise ValueError('checksum mismatch')
         return cls(int.from_bytes(b, 'big'))
 
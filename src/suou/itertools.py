@@ -14,7 +14,9 @@ This software is distributed on an "AS IS" BASIS,
 WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 '''
 
+from collections import deque
 from functools import wraps
+from itertools import islice
 from typing import Any, Callable, Iterable, MutableMapping, TypeVar
 import warnings
 
@@ -28,12 +30,32 @@ def _makelist_callable(l: Callable) -> Callable[..., list]:
         return _makelist_nowrap(l(*a, **k))
     return wrapper
 
+def _makelist_single(l: Any) -> list:
+    return [l]
+
+def _makelist_empty(l: Any) -> list:
+    return []
+
+# exact types only, subclasses go through the isinstance() chain
+_MAKELIST_FAST: dict[type, Callable[[Any], list]] = {
+    list: list,
+    tuple: list,
+    str: _makelist_single,
+    bytes: _makelist_single,
+    bytearray: _makelist_single,
+    int: _makelist_single,
+    type(None): _makelist_empty,
+}
+
 def _makelist_nowrap(l: Any) -> list:
+    fn = _MAKELIST_FAST.get(type(l))
+    if fn is not None:
+        return fn(l)
     if isinstance(l, (str, bytes, bytearray)):
         return [l]
     elif isinstance(l, Iterable):
         return list(l)
-    elif l in (None, NotImplemented, Ellipsis, MISSING):
+    elif l is None or l is NotImplemented or l is Ellipsis or l is MISSING:
         return []
     else:
         return [l]
@@ -56,7 +78,7 @@ def ltuple(seq: Iterable[_T], size: int, /, pad = None) -> tuple[_T, ...]:
     """
     Truncate an iterable into a fixed size tuple, if necessary padding it.
     """
-    seq = tuple(seq)[:size]
+    seq = tuple(islice(seq, size))
     if len(seq) < size:
         seq = seq + (pad,) * (size - len(seq))
     return seq
@@ -65,7 +87,7 @@ def rtuple(seq: Iterable[_T], size: int, /, pad = None) -> tuple[_T, ...]:
     """
     Same as rtuple() but the padding and truncation is made right to left.
     """
-    seq = tuple(seq)[-size:]
+    seq = tuple(deque(seq, maxlen=size))
     if len(seq) < size:
         seq = (pad,) * (size - len(seq)) + seq
     return seq
@@ -81,14 +103,16 @@ def kwargs_prefix(it: dict[str, Any], prefix: str, *, remove = True, keep_prefix
     By default, specified prefix is removed from each key of the returned
     dictionary; keep_prefix=True keeps the prefix on keys.
     '''
-    keys = [k for k in it.keys() if k.startswith(prefix)]
+    keys = [k for k in it if k.startswith(prefix)]
 
-    ka = dict()
-    for k in keys:
-        ka[k if keep_prefix else k.removeprefix(prefix)] = it[k]
+    if keep_prefix:
+        ka = {k: it[k] for k in keys}
+    else:
+        pl = len(prefix)
+        ka = {k[pl:]: it[k] for k in keys}
     if remove:
         for k in keys:
-            it.pop(k)
+            del it[k]
     return ka
 
 def additem(obj: MutableMapping, /, name: str | None = None):
@@ -72,27 +72,33 @@ class Lawyer(SpitText):
         self.jurisdiction = jurisdiction
         self.country = country
         self.country_adjective = country_adjective
+        # inputs don't change, render everything once
+        self._indemnify = self.format(INDEMNIFY, 'app_name')
+        self._no_warranty = self.format(NO_WARRANTY, 'app_name', 'company_name')
+        self._governing_law = self.format(GOVERNING_LAW, 'country', 'jurisdiction', 'app_name', 'country_adjective')
+        self._expect_updates = self.format(EXPECT_UPDATES, 'app_name')
+        self._completeness = self.format(COMPLETENESS, 'app_name')
 
     def indemnify(self):
-        return self.format(INDEMNIFY, 'app_name')
+        return self._indemnify
 
     def no_warranty(self):
-        return self.format(NO_WARRANTY, 'app_name', 'company_name')
+        return self._no_warranty
 
     def governing_law(self) -> str:
-        return self.format(GOVERNING_LAW, 'country', 'jurisdiction', 'app_name', 'country_adjective')
+        return self._governing_law
 
     def english_first(self) -> str:
         return ENGLISH_FIRST
     
     def expect_updates(self) -> str:
-        return self.format(EXPECT_UPDATES, 'app_name')
+        return self._expect_updates
 
     def severability(self) -> str:
         return SEVERABILITY
 
     def completeness(self) -> str:
-        return self.format(COMPLETENESS, 'app_name')
+        return self._completeness
 
 # This module is experimental and therefore not re-exported into __init__
 __all__ = ('Lawyer',)
@@ -17,8 +17,9 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 from re import Match
 
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import re
+import sys
 from typing import Any, Callable, Iterable
 
 from .exceptions import InconsistencyError, LexError
@@ -32,13 +33,51 @@ class TokenSym:
     label: str
     cast: Callable[[str], Any] | None = None
     discard: bool = False
+    _compiled: re.Pattern = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # compile once, not on every scan position
+        self._compiled = re.compile(self.pattern)
+        if isinstance(self.label, str):
+            self.label = sys.intern(self.label)
 
     # convenience methods below
     def match(self, s: str, index: int = 0) -> Match[str] | None:
-        return re.compile(self.pattern, 0).match(s, index)
+        return self._compiled.match(s, index)
+
+# numbered backreferences would point to the wrong group once patterns are fused
+_NUMBERED_BACKREF = re.compile(r'\\[1-9]')
+
+class SymbolTable(list):
+    """
+    List of TokenSym's, as returned by symbol_table().
+
+    All the patterns are also fused into a single alternation, so that ilex()
+    needs one regex match per token instead of one per symbol tried.
+    Order is preserved, i.e. the first matching symbol wins.
 
-@makelist
-def symbol_table(*args: Iterable[tuple | TokenSym], whitespace: str | None = None):
+    *New in 0.14.0*
+    """
+    master: re.Pattern | None
+    group_map: dict[str, TokenSym]
+
+    def __init__(self, syms: Iterable[TokenSym] = (), /):
+        super().__init__(syms)
+        self._build()
+
+    def _build(self):
+        self.group_map = {f'_t{i}': sym for i, sym in enumerate(self)}
+        self.master = None
+        if not self or any(_NUMBERED_BACKREF.search(sym.pattern) for sym in self):
+            return
+        try:
+            self.master = re.compile('|'.join(f'(?P<{name}>{sym.pattern})' for name, sym in self.group_map.items()))
+        except re.error:
+            # e.g. global flags or clashing group names; ilex() tries symbols one by one
+            pass
+
+
+def symbol_table(*args: Iterable[tuple | TokenSym], whitespace: str | None = None) -> SymbolTable:
     """
     Make a symbol table from a list of tuples.
 
@@ -49,7 +88,10 @@ def symbol_table(*args: Iterable[tuple | TokenSym], whitespace: str | None = Non
     - cast is a function 
 
     Need to strip whitespace? Pass the whitespace= keyword parameter.
+
+    *Changed in 0.14.0*: returns a SymbolTable (a list subclass)
     """
+    syms = []
     for arg in args:
         if isinstance(arg, TokenSym):
             pass
@@ -57,38 +99,87 @@ def symbol_table(*args: Iterable[tuple | TokenSym], whitespace: str | None = Non
             arg = TokenSym(*arg)
         else:
             raise TypeError(f'invalid type {arg.__class__.__name__!r}')
-        yield arg
+        syms.append(arg)
     if whitespace:
-        yield TokenSym('[' + re.escape(whitespace) + ']+', '', discard=True)
+        syms.append(TokenSym('[' + re.escape(whitespace) + ']+', '', discard=True))
+    return SymbolTable(syms)
 
 
+# longer token texts are unlikely to repeat
+_INTERN_MAX = 32
+
+def _emit(sym: TokenSym, mo: Match[str], whitespace: bool):
+    if not sym.discard:
+        mtext = mo.group(0)
+        if callable(sym.cast):
+            mtext = sym.cast(mtext)
+        elif len(mtext) <= _INTERN_MAX:
+            # identifiers and operators repeat a lot: share one string each
+            mtext = sys.intern(mtext)
+        return (sym.label, mtext)
+    elif whitespace:
+        return (None, mo.group(0))
+    return None
+
+
+# plain lists passed to ilex(), by the ids of their symbols
+_TABLE_CACHE: dict[tuple[int, ...], SymbolTable] = {}
+_TABLE_CACHE_MAX = 64
+
+def _as_symbol_table(syms: Iterable[TokenSym]) -> SymbolTable:
+    """
+    SymbolTable for a plain list of symbols, so that patterns are fused once per list.
+    """
+    syms = tuple(syms)
+    key = tuple(map(id, syms))
+    table = _TABLE_CACHE.get(key)
+    # the cached table holds on to its symbols, so their ids can't have been reused
+    if table is None or any(a is not b for a, b in zip(table, syms)):
+        if len(_TABLE_CACHE) >= _TABLE_CACHE_MAX:
+            _TABLE_CACHE.clear()
+        table = _TABLE_CACHE[key] = SymbolTable(syms)
+    return table
+
 def ilex(text: str, table: Iterable[TokenSym], *, whitespace = False):
     """
     Return a text as a list of tokens, given a token table (iterable of TokenSym).
 
     ilex() returns a generator; lex() returns a list.
 
-    table must be a result from symbol_table().
+    table should be a result from symbol_table(); plain lists work too,
+    and their patterns are fused once per list of symbols.
     """
+    if not isinstance(table, SymbolTable) or len(table.group_map) != len(table):
+        table = _as_symbol_table(table)
+    master, group_map = table.master, table.group_map
     i = 0
+    if master is not None:
+        # the scan loop runs inside the regex engine; a gap between matches is an illegal character
+        for mo in master.finditer(text):
+            if mo.start(0) != i or i == len(text):
+                break
+            if i == mo.end(0):
+                raise InconsistencyError
+            if (tok := _emit(group_map[mo.lastgroup], mo, whitespace)) is not None:
+                yield tok
+            i = mo.end(0)
+        if i < len(text):
+            raise LexError(f'illegal character near {text[i:i+5]!r}')
+        return
+    # symbols are tried in table order: one of them may start with whitespace
     while i < len(text):
         mo = None
         for sym in table:
-            if mo := re.compile(sym.pattern).match(text, i):
-                if not sym.discard:
-                    mtext = mo.group(0)
-                    if callable(sym.cast):
-                        mtext = sym.cast(mtext)
-                    yield (sym.label, mtext)
-                elif whitespace:
-                    yield (None, mo.group(0))
+            if mo := sym._compiled.match(text, i):
                 break
         if mo is None:
             raise LexError(f'illegal character near {text[i:i+5]!r}')
+        if (tok := _emit(sym, mo, whitespace)) is not None:
+            yield tok
         if i == mo.end(0):
             raise InconsistencyError
         i = mo.end(0)
 
 lex: Callable[..., list] = makelist(ilex)
 
-__all__ = ('symbol_table', 'lex', 'ilex')
\ No newline at end of file
+__all__ = ('symbol_table', 'lex', 'ilex', 'SymbolTable')
\ No newline at end of file
@@ -34,7 +34,11 @@ def lucky(validators: Iterable[Callable[[_U], bool]] = ()):
     UNTESTED 
 
     *New in 0.7.0*
+
+    *Changed in 0.14.0*: validators are consumed once, at decoration time
     """
+    validators = tuple(validators)
+
     def decorator(func: Callable[..., _U]) -> Callable[..., _U]:
         @wraps(func)
         def wrapper(*args, **kwargs) -> _U:
@@ -42,6 +46,8 @@ def lucky(validators: Iterable[Callable[[_U], bool]] = ()):
                 result = func(*args, **kwargs)
             except Exception as e:
                 raise BadLuckError(f'exception happened: {e}') from e
+            if not validators:
+                return result
             for v in validators:
                 try:
                     if not v(result):
@@ -64,7 +70,9 @@ class RngCallable(Callable, Generic[_T, _U]):
     *New in 0.7.0*
     """
     def __init__(self, /, func: Callable[_T, _U] | None = None, weight: int = 1):
-        self._callables = []
+        self._funcs = []
+        # cumulative weights, for random.choices()
+        self._cum_weights = []
         self._max_weight = 0
         if callable(func):
             self.add_callable(func, weight)
@@ -74,17 +82,13 @@ class RngCallable(Callable, Generic[_T, _U]):
         weight = int(weight)
         if weight <= 0:
             return
-        self._callables.append((func, weight))
         self._max_weight += weight
+        self._funcs.append(func)
+        self._cum_weights.append(self._max_weight)
     def __call__(self, *a, **ka) -> _U:
-        choice = random.randrange(self._max_weight)
-        for w, c in self._callables:
-            if choice < w:
-                return c(*a, **ka)
-            elif choice < 0:
-                raise RuntimeError('inconsistent state')
-            else:
-                choice -= w
+        if not self._funcs:
+            raise RuntimeError('no callables to choose from')
+        return random.choices(self._funcs, cum_weights=self._cum_weights)[0](*a, **ka)
 
 
 def rng_overload(prev_func: RngCallable[..., _U] | int | None, /, *, weight: int = 1) -> RngCallable[..., _U]:
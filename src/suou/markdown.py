@@ -30,13 +30,11 @@ class StrikethroughExtension(markdown.extensions.Extension):
         md.postprocessors.register(postprocessor, 'strikethrough', 0)
 
 class StrikethroughPostprocessor(markdown.postprocessors.Postprocessor):
-    PATTERN = re.compile(r"~~(((?!~~).)+)~~", re.DOTALL)
+    # unrolled form of ~~(((?!~~).)+)~~: each repetition must start at a single tilde
+    PATTERN = re.compile(r"~~(?!~~)([^~]*(?:~(?!~)[^~]*)*)~~")
 
     def run(self, html):
-        return re.sub(self.PATTERN, self.convert, html)
-
-    def convert(self, match: re.Match):
-        return '<del>' + match.group(1) + '</del>'
+        return self.PATTERN.sub(r'<del>\1</del>', html)
 
 
 class SpoilerExtension(markdown.extensions.Extension):
@@ -17,11 +17,42 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 """
 
 from __future__ import annotations
+from array import array
+from operator import mul
 from typing import Collection, Iterable, TypeVar
 from .functools import deprecated
 
+try:
+    import numpy as np
+except ImportError:
+    # optional, only used to speed up large products
+    np = None
+
 _T = TypeVar('_T')
 
+# below this many multiplications, converting to numpy costs more than it saves
+_NUMPY_MIN_OPS = 4096
+
+def _pack(elements: list) -> list | array:
+    """
+    Store all-float elements as raw doubles (8 bytes each instead of a
+    pointer to a boxed float); anything else stays a list.
+    """
+    if elements and all(type(x) is float for x in elements):
+        return array('d', elements)
+    return elements
+
+def _as_list(seq: list | array) -> list:
+    return seq.tolist() if type(seq) is array else seq
+
+def _want_index(idx: int, n: int, what: str) -> int:
+    # slices don't complain about bad indices, so check them beforehand
+    if idx < 0:
+        idx += n
+    if not 0 <= idx < n:
+        raise IndexError(f'{what} index out of range')
+    return idx
+
 class Matrix(Collection[_T]):
     """
     Minimalist reimplementation of matrices in pure Python.
@@ -29,9 +60,11 @@ class Matrix(Collection[_T]):
     This to avoid adding numpy as a dependency.
 
     *New in 0.12.0*
+
+    *Changed in 0.14.0*: matrices of floats are stored in an array.array
     """
     _shape: tuple[int, int]
-    _elements: list[_T]
+    _elements: list[_T] | array
 
     def shape(self):
         return self._shape
@@ -40,7 +73,8 @@ class Matrix(Collection[_T]):
         elements = []
         boundary_x = boundary_y = 0
         for row in iterable:
-            if isinstance(row, Collection):
+            # concrete types first: isinstance() against the ABC is slow
+            if type(row) in (list, tuple) or isinstance(row, Collection):
                 if not boundary_y:
                     boundary_y = len(row)
                     elements.extend(row)
@@ -55,45 +89,81 @@ class Matrix(Collection[_T]):
                     boundary_x, boundary_y = shape
                 elements.append(row)
         self._shape = boundary_x, boundary_y
-        self._elements = elements
+        self._elements = _pack(elements)
         assert len(self._elements) == boundary_x * boundary_y
 
     def __getitem__(self, key: tuple[int, int]) -> _T:
-        (x, y), (_, sy) = key, self.shape()
-        
-        return self._elements[x * sy + y]
+        x, y = key
+        return self._elements[x * self._shape[1] + y]
 
     @property
     def T(self):
-        sx, sy = self.shape()
-        return Matrix(
-            [
-                [
-                    self[j, i] for j in range(sx)
-                ] for i in range(sy)
-            ]
-        )
+        sx, sy = self._shape
+        el = self._elements
+        # empty slice: an empty list, or an empty array of the same typecode
+        out = el[:0]
+        for i in range(sy):
+            # column i of self is row i of the transpose
+            out.extend(el[i::sy])
+        r = Matrix.__new__(Matrix)
+        r._shape = (sy, sx)
+        r._elements = out
+        return r
 
     def __matmul__(self, other: Matrix) -> Matrix:
-        (ax, ay), (bx, by) = self.shape(), other.shape()
+        (ax, ay), (bx, by) = self._shape, other._shape
 
         if ay != bx:
             raise ValueError('cannot multiply matrices with incompatible shape')
+
+        if np is not None and ax * ay * by >= _NUMPY_MIN_OPS:
+            result = self._numpy_matmul(other)
+            if result is not None:
+                return result
         
-        return Matrix([
-            [
-                sum(self[i, k] * other[k, j] for k in range(ay)) for j in range(by)
-            ] for i in range(ax)
-        ])
+        # dot products run in C via map(mul, ...) over row and column slices
+        cols = list(other._columns())
+        out = [
+            sum(map(mul, row, col)) for row in self._rows() for col in cols
+        ]
+        r = Matrix.__new__(Matrix)
+        r._shape = (ax, by)
+        r._elements = _pack(out)
+        return r
+
+    def _numpy_matmul(self, other: Matrix) -> Matrix | None:
+        """
+        Matrix product computed by numpy, or None if elements are not
+        all floats or all ints (within int64 range).
+        """
+        ea, eb = self._elements, other._elements
+        if type(ea) is array and type(eb) is array:
+            dtype = np.float64
+        elif all(type(x) is int for x in ea) and all(type(x) is int for x in eb):
+            # Python ints never overflow, int64 does
+            if not ea or not eb or (max(map(abs, ea)) * max(map(abs, eb)) * self._shape[1]) >= 1 << 63:
+                return None
+            dtype = np.int64
+        else:
+            return None
+        out = np.asarray(ea, dtype=dtype).reshape(self._shape) @ np.asarray(eb, dtype=dtype).reshape(other._shape)
+        r = Matrix.__new__(Matrix)
+        r._shape = (self._shape[0], other._shape[1])
+        r._elements = array('d', out.ravel().tolist()) if dtype is np.float64 else out.ravel().tolist()
+        return r
 
     def __eq__(self, other: Matrix):
         try:
-            return self._elements == other._elements and self._shape == other._shape
+            a, b = self._elements, other._elements
+            if type(a) is not type(b):
+                # array.array never compares equal to a list
+                a, b = list(a), list(b)
+            return a == b and self._shape == other._shape
         except Exception:
             return False
 
     def __len__(self):
-        ax, ay = self.shape()
+        ax, ay = self._shape
         return ax * ay
 
     @deprecated('please use .rows() or .columns() instead')
@@ -107,15 +177,23 @@ class Matrix(Collection[_T]):
         return f'{self.__class__.__name__}({list(self.rows())})'
 
     def rows(self):
-        sx, sy = self.shape()
+        return map(_as_list, self._rows())
+
+    def columns(self):
+        return map(_as_list, self._columns())
+
+    def _rows(self):
+        sx, sy = self._shape
+        el = self._elements
         return (
-            [self[j, i] for j in range(sy)] for i in range(sx)
+            el[i * sy:(i + 1) * sy] for i in range(sx)
         )
 
-    def columns(self):
-        sx, sy = self.shape()
+    def _columns(self):
+        sy = self._shape[1]
+        el = self._elements
         return (
-            [self[j, i] for j in range(sx)] for i in range(sy)
+            el[i::sy] for i in range(sy)
         )
 
     @classmethod
@@ -127,16 +205,14 @@ class Matrix(Collection[_T]):
         return cls([[x] for x in iterable])
 
     def get_column(self, idx = 0):
-        sx, _ = self.shape()
-        return [
-            self[j, idx] for j in range(sx)
-        ]
+        sy = self._shape[1]
+        idx = _want_index(idx, sy, 'column')
+        return _as_list(self._elements[idx::sy])
 
     def get_row(self, idx = 0):
-        _, sy = self.shape()
-        return [
-            self[idx, j] for j in range(sy)
-        ]
+        sx, sy = self._shape
+        idx = _want_index(idx, sx, 'row')
+        return _as_list(self._elements[idx * sy:(idx + 1) * sy])
 
 __all__ = ('Matrix', )
 
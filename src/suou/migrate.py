@@ -16,13 +16,28 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 
 
 from abc import abstractmethod
-from typing import override
+from typing import Iterable, override
 
 from .functools import not_implemented
 from .iding import SiqType, make_domain_hash
 
 from .bits import mask_shift, count_ones
 
+def _contiguous_shift(mask: int) -> int | None:
+    """
+    Position of the lowest set bit of mask, if its set bits are contiguous.
+
+    In that case, mask_shift(n, mask) == (n & mask) >> shift. Returns None otherwise.
+    """
+    if mask <= 0:
+        return None
+    shift = (mask & -mask).bit_length() - 1
+    m = mask >> shift
+    return shift if m & (m + 1) == 0 else None
+
+# bits left to the progressive counter, for each SIQ type
+_SER_BITS = {t: 16 - t.n_bits for t in SiqType}
+
 class SiqMigrator:
     """
     Base class for SIQ migrators.
@@ -32,11 +47,24 @@ class SiqMigrator:
     """
     def __init__(self, domain: str) -> None:
         self.domain_hash = make_domain_hash(domain)
+        self._domain_bits = (self.domain_hash % 0xffffffff) << 16
 
     @abstractmethod
     def to_siq(self, orig_id, target_type: SiqType) -> int:
         pass
 
+    def to_siq_bulk(self, orig_ids: Iterable, target_type: SiqType) -> list[int]:
+        """
+        Convert many ID's at once, all to the same target_type.
+
+        Subclasses override this to compute the per-target_type
+        constants only once; this fallback just calls .to_siq().
+
+        *New in 0.14.0*
+        """
+        to_siq = self.to_siq
+        return [to_siq(orig_id, target_type) for orig_id in orig_ids]
+
 class SnowflakeSiqMigrator(SiqMigrator):
     """
     Migrate from Snowflake ID's (i.e. the ones in use at Twitter / Discord).
@@ -73,18 +101,35 @@ class SnowflakeSiqMigrator(SiqMigrator):
         self.shard_mask = shard_mask
         self.shard_ts_mask = shard_ts_mask
         self.serial_mask = serial_mask
+        # masks are fixed: if contiguous (they are by default), extract with a plain shift
+        self._shard_shift = _contiguous_shift(shard_mask)
+        self._shard_ts_shift = _contiguous_shift(shard_ts_mask)
+        self._serial_shift = _contiguous_shift(serial_mask)
+        self._orig_ser_bits = count_ones(serial_mask)
 
     @override
     def to_siq(self, orig_id: int, target_type: SiqType) -> int:
         ts_ms = (orig_id >> self.ts_stop) + self.epoch
         ts = int(ts_ms / self.ts_accuracy * (1 << 16))
-        shard = mask_shift(orig_id, self.shard_mask)
+        shard = (
+            (orig_id & self.shard_mask) >> self._shard_shift
+            if self._shard_shift is not None else
+            mask_shift(orig_id, self.shard_mask)
+        )
         shard_hi = 0
         if self.shard_ts_mask:
-            shard_hi += mask_shift(orig_id, self.shard_ts_mask)
-        ser = mask_shift(orig_id, self.serial_mask)
-        ser_bits = 16 - target_type.n_bits
-        orig_ser_bits = count_ones(self.serial_mask)
+            shard_hi += (
+                (orig_id & self.shard_ts_mask) >> self._shard_ts_shift
+                if self._shard_ts_shift is not None else
+                mask_shift(orig_id, self.shard_ts_mask)
+            )
+        ser = (
+            (orig_id & self.serial_mask) >> self._serial_shift
+            if self._serial_shift is not None else
+            mask_shift(orig_id, self.serial_mask)
+        )
+        ser_bits = _SER_BITS[target_type]
+        orig_ser_bits = self._orig_ser_bits
         if ser_bits < orig_ser_bits:
             ser, ser_hi = ser % (1 << ser_bits), ser >> ser_bits
             shard_hi <<= orig_ser_bits - ser_bits
@@ -93,10 +138,56 @@ class SnowflakeSiqMigrator(SiqMigrator):
         return (
             (ts << 56)|
             ((shard % 256) << 48)|
-            ((self.domain_hash % 0xffffffff)<< 16)|
+            self._domain_bits|
             (target_type.prepend(ser) % 0xffff)
         )
-        
+
+    @override
+    def to_siq_bulk(self, orig_ids: Iterable[int], target_type: SiqType) -> list[int]:
+        ts_stop, epoch, ts_accuracy = self.ts_stop, self.epoch, self.ts_accuracy
+        shard_mask, shard_ts_mask, serial_mask = self.shard_mask, self.shard_ts_mask, self.serial_mask
+        shard_shift, shard_ts_shift, serial_shift = self._shard_shift, self._shard_ts_shift, self._serial_shift
+        domain_bits = self._domain_bits
+        ser_bits = _SER_BITS[target_type]
+        orig_ser_bits = self._orig_ser_bits
+        # same as the .to_siq() branch on ser_bits < orig_ser_bits, decided once
+        split = ser_bits < orig_ser_bits
+        ser_mod = 1 << ser_bits
+        hi_shift = orig_ser_bits - ser_bits
+        nb = target_type.n_bits
+        type_bits = target_type.prepend(0)
+
+        result = []
+        for orig_id in orig_ids:
+            ts = int(((orig_id >> ts_stop) + epoch) / ts_accuracy * (1 << 16))
+            shard = (
+                (orig_id & shard_mask) >> shard_shift
+                if shard_shift is not None else
+                mask_shift(orig_id, shard_mask)
+            )
+            shard_hi = 0
+            if shard_ts_mask:
+                shard_hi = (
+                    (orig_id & shard_ts_mask) >> shard_ts_shift
+                    if shard_ts_shift is not None else
+                    mask_shift(orig_id, shard_ts_mask)
+                )
+            ser = (
+                (orig_id & serial_mask) >> serial_shift
+                if serial_shift is not None else
+                mask_shift(orig_id, serial_mask)
+            )
+            if split:
+                ser, ser_hi = ser % ser_mod, ser >> ser_bits
+                shard_hi = (shard_hi << hi_shift) + ser_hi
+            result.append(
+                ((ts + shard_hi) << 56)|
+                ((shard % 256) << 48)|
+                domain_bits|
+                (((ser << nb) | type_bits) % 0xffff)
+            )
+        return result
+
 
 class UlidSiqMigrator(SiqMigrator):
     '''
@@ -120,18 +211,33 @@ class UlidSiqMigrator(SiqMigrator):
 
     @override
     def to_siq(self, orig_id, target_type: SiqType) -> int:
-        ts_seq   = mask_shift(orig_id, 0xfc000000000000000000)
-        shard    = mask_shift(orig_id,  0x3fc0000000000000000)
-        seq      = mask_shift(orig_id,    0x3fffc000000000000)
+        # i.e. mask_shift() with masks 0xfc000000000000000000, 0x3fc0000000000000000
+        # and 0x3fffc000000000000 respectively, minus the 80-bit operands
+        ts_seq   = (orig_id >> 74) & 0x3f
+        shard    = (orig_id >> 66) & 0xff
+        seq      = (orig_id >> 50) & 0xffff
 
         ts = ((orig_id >> 80) << 16) // 1000 + ts_seq
         return (
             (ts << 56)|
             ((shard % 256) << 48)|
-            ((self.domain_hash % 0xffffffff) << 16)|
+            self._domain_bits|
             (((seq & ~((1 << target_type.n_bits) - 1)) | target_type.prepend(0)) % 0xffff)
         )
 
+    @override
+    def to_siq_bulk(self, orig_ids: Iterable[int], target_type: SiqType) -> list[int]:
+        domain_bits = self._domain_bits
+        seq_mask = ~((1 << target_type.n_bits) - 1)
+        type_bits = target_type.prepend(0)
+        return [
+            ((((orig_id >> 80) << 16) // 1000 + ((orig_id >> 74) & 0x3f)) << 56)|
+            (((orig_id >> 66) & 0xff) << 48)|
+            domain_bits|
+            (((((orig_id >> 50) & 0xffff) & seq_mask) | type_bits) % 0xffff)
+            for orig_id in orig_ids
+        ]
+
 
 __all__ = (
     'SnowflakeSiqMigrator', 'UlidSiqMigrator'
@@ -16,7 +16,7 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 
 
 from contextvars import ContextVar
-from typing import Iterable
+from typing import Callable, Iterable
 from playhouse.shortcuts import ReconnectMixin
 from peewee import BigIntegerField, CharField, Database, Field, MySQLDatabase, _ConnectionState
 import re
@@ -82,17 +82,23 @@ class RegexCharField(CharField):
     '''
     regex: str
     text_transform: StringCase
+    _rgx: re.Pattern
+    _transform: Callable[[str], str] | None
     def __init__(self, regex: str, *a, text_transform: StringCase | None = None, **k):
         self.regex = regex
         self.text_transform = text_transform or StringCase.AS_IS
+        # both are fixed for the lifetime of the field: no need to redo them on every write
+        self._rgx = self.text_transform.compile(regex)
+        self._transform = (
+            str.upper if self.text_transform == StringCase.UPPER else
+            str.lower if self.text_transform == StringCase.LOWER else
+            None
+        )
         super().__init__(*a, **k)
     def db_value(self, value: str):
-        if self.text_transform == StringCase.UPPER:
-            value = value.upper()
-        if self.text_transform == StringCase.LOWER:
-            value = value.lower()
-        rgx: re.Pattern = self.text_transform.compile(self.regex)
-        if not rgx.fullmatch(value):
+        if self._transform is not None:
+            value = self._transform(value)
+        if not self._rgx.fullmatch(value):
             raise ValueError(f'value does not match regexp {self.regex!r}')
         return CharField.db_value(self, value)
 
@@ -107,7 +113,16 @@ class SiqField(Field):
     '''
     field_type = 'varbinary(16)'
 
+    # exact types only, subclasses take the isinstance() path below
+    _DB_VALUE: dict[type, Callable[..., bytes]] = {
+        bytes: lambda v: v,
+        int: lambda v: v.to_bytes(14, 'big'),
+        Siq: Siq.to_bytes
+    }
+
     def db_value(self, value: int | Siq | bytes) -> bytes:
+        if (conv := self._DB_VALUE.get(type(value))) is not None:
+            return conv(value)
         if isinstance(value, int):
             value = Siq(value)
         if isinstance(value, Siq):
@@ -25,8 +25,11 @@ from .sqlalchemy.asyncio import AsyncSession, SQLAlchemy
 
 _T = TypeVar('_T')
 
+def _by_id(user_class, auth_id: str):
+    return user_class.id == int(auth_id)
+
 def user_loader(database: SQLAlchemy, user_class: type[DeclarativeBase], *,
-        attr_loader: Callable[[type[AuthUser], str], _T] = lambda x, y: x.id == int(y)
+        attr_loader: Callable[[type[AuthUser], str], _T] = _by_id
     ):
     """
     Returns a properly subclassed AuthUser loader for use in Quart-Auth.
@@ -43,8 +46,21 @@ def user_loader(database: SQLAlchemy, user_class: type[DeclarativeBase], *,
     * attr_loader A lambda taking user_class and auth_id, default (user_class, auth_id : user_class.id == int(auth_id))
 
     *New in 0.12.0*
+
+    *Changed in 0.14.0*: mapped column attributes are proxied by
+    properties instead of __getattr__(); the default attr_loader
+    fetches by primary key.
     """
+    base_stmt = select(user_class)
+    mapper = user_class.__mapper__
+    # the default attr_loader is a lookup by primary key, if "id" is the whole key
+    by_pk = attr_loader is _by_id and len(mapper.primary_key) == 1 and \
+        mapper.get_property_by_column(mapper.primary_key[0]).key == 'id'
+
     class UserLoader(AuthUser):
+        # AuthUser has no __slots__, but as long as every field set is a slot, no __dict__ is ever allocated
+        __slots__ = ('_auth_id', '_auth_obj', '_auth_sess', 'action')
+
         _auth_id: str | None
         _auth_obj: user_class | None
         id: _T
@@ -67,11 +83,15 @@ def user_loader(database: SQLAlchemy, user_class: type[DeclarativeBase], *,
         async def _load(self):
             if self._auth_obj is None and self._auth_id is not None:
                 async with database as session:
-                    self._auth_obj = (await session.execute(select(user_class).where(attr_loader(user_class, self._auth_id)))).scalar()
+                    if by_pk:
+                        self._auth_obj = await session.get(user_class, int(self._auth_id))
+                    else:
+                        self._auth_obj = (await session.execute(base_stmt.where(attr_loader(user_class, self._auth_id)))).scalar()
                     if self._auth_obj is None:
                         raise RuntimeError('failed to fetch user')
         
         def __getattr__(self, key):
+            # relationships and anything else not mapped to a column
             if self._auth_obj is None:
                 raise RuntimeError('user is not loaded')
             return getattr(self._auth_obj, key)
@@ -92,8 +112,23 @@ def user_loader(database: SQLAlchemy, user_class: type[DeclarativeBase], *,
         def user(self):
             return self._auth_obj
 
+    for attr in mapper.column_attrs:
+        if not hasattr(UserLoader, attr.key):
+            setattr(UserLoader, attr.key, _proxy_property(attr.key))
+
     return UserLoader
 
+def _proxy_property(key: str) -> property:
+    def getter(self):
+        if (obj := self._auth_obj) is None:
+            raise RuntimeError('user is not loaded')
+        try:
+            return obj.__dict__[key]
+        except KeyError:
+            # expired or deferred: let SQLAlchemy load it
+            return getattr(obj, key)
+    return property(getter)
+
 # Optional dependency: do not import into __init__.py
 __all__ = ('user_loader',)
 
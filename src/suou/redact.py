@@ -18,6 +18,7 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 
 import re
 
+_PW_RE = re.compile(r':[^@:/ ]+@')
 
 def redact_url_password(u: str) -> str:
     """
@@ -29,7 +30,9 @@ def redact_url_password(u: str) -> str:
 
     *New in 0.5.0*
     """
-    return re.sub(r':[^@:/ ]+@', ':***@', u)
+    if '@' not in u:
+        return u
+    return _PW_RE.sub(':***@', u)
 
 
 __all__ = ('redact_url_password', )
\ No newline at end of file
@@ -15,6 +15,7 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 """
 
 
+import asyncio
 import datetime
 import logging
 import os
@@ -35,6 +36,18 @@ logger = logging.getLogger(__name__)
 ## NOTE Python/PSF recommends use of importlib.metadata for version checks.
 _libsass_version = _get_version('libsass')
 
+_CHUNK_SIZE = 64 * 1024
+
+def _newest_mtime(dirname: str) -> int:
+    """
+    Latest modification time (in ns) of the files under dirname.
+    """
+    newest = os.stat(dirname).st_mtime_ns
+    for root, _, files in os.walk(dirname):
+        for name in files:
+            newest = max(newest, os.stat(os.path.join(root, name)).st_mtime_ns)
+    return newest
+
 class SassAsyncMiddleware(_MiddlewareFactory):
     """
     ASGI middleware for development purpose.
@@ -75,6 +88,38 @@ class SassAsyncMiddleware(_MiddlewareFactory):
             asgi_path = f'/{manifest.wsgi_path.strip('/')}/'
             pkg_dir = self.package_dir[pkgname]
             self.paths.append((asgi_path, pkg_dir, manifest))
+        # (wsgi_path, package_dir, sass_filename) -> (newest mtime, CSS filename, compile error message)
+        self._compile_cache: dict[tuple[str, str, str], tuple[int, str | None, str | None]] = {}
+
+    def _build_one(self, manifest: Manifest, package_dir: str, sass_filename: str) -> str:
+        """
+        manifest.build_one(), skipped if no Sass source changed since the last build.
+
+        Compile errors are remembered as well, and raised again until sources change.
+        """
+        key = (manifest.wsgi_path, package_dir, sass_filename)
+        # any partial may be @import'ed, so all sources count
+        mtime = _newest_mtime(os.path.join(package_dir, manifest.sass_path))
+        cached = self._compile_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            _, result, error = cached
+            if error is not None:
+                # a fresh exception each time, so that tracebacks don't pile up
+                raise CompileError(error)
+            if os.path.exists(os.path.join(package_dir, result)):
+                return result
+        try:
+            result = manifest.build_one(
+                package_dir,
+                sass_filename,
+                source_map=True
+            )
+        except CompileError as e:
+            # only the latest build of each file is kept
+            self._compile_cache[key] = (mtime, None, str(e))
+            raise
+        self._compile_cache[key] = (mtime, result, None)
+        return result
     
     async def __call__(self, /, scope: ASGIScope, receive: ASGIReceive, send: ASGISend):
         path: str = scope.get('path')
@@ -86,11 +131,7 @@ class SassAsyncMiddleware(_MiddlewareFactory):
                 sass_filename = manifest.unresolve_filename(package_dir, css_filename)
                 try:
                     ## TODO consider async??
-                    result = manifest.build_one(
-                        package_dir,
-                        sass_filename,
-                        source_map=True
-                    )
+                    result = self._build_one(manifest, package_dir, sass_filename)
                 except OSError:
                     break
                 except CompileError as e:
@@ -128,33 +169,38 @@ class SassAsyncMiddleware(_MiddlewareFactory):
 
                     return
 
-                async def _read_file(path):
-                    with open(path, 'rb') as f:
-                        while True:
-                            chunk = f.read(4096)
-                            if chunk:
-                                yield chunk
-                            else:
-                                break
-                
-                file_path = os.path.join(package_dir, result)
+                file_path = os.path.abspath(os.path.join(package_dir, result))
 
-                await send({
-                    'type': 'http.response.start',
-                    'status': 200,
-                    'headers': [
-                        (b'Content-Type', b'text/css; charset=utf-8'),
-                        (b'Content-Length', want_bytes(f'{os.path.getsize(file_path)}'))
-                    ]
-                })
+                # Content-Length comes from the open file: no separate stat() by path
+                with open(file_path, 'rb') as f:
+                    await send({
+                        'type': 'http.response.start',
+                        'status': 200,
+                        'headers': [
+                            (b'Content-Type', b'text/css; charset=utf-8'),
+                            (b'Content-Length', want_bytes(f'{os.fstat(f.fileno()).st_size}'))
+                        ]
+                    })
 
-                resp_body = b''
-                async for chunk in _read_file(file_path):
-                    resp_body += chunk
-                    
+                    if 'http.response.pathsend' in (scope.get('extensions') or {}):
+                        # the server copies the file itself, possibly with sendfile()
+                        await send({
+                            'type': 'http.response.pathsend',
+                            'path': file_path
+                        })
+                        return
+
+                    # blocking reads stay off the event loop
+                    while chunk := await asyncio.to_thread(f.read, _CHUNK_SIZE):
+                        await send({
+                            'type': 'http.response.body',
+                            'body': chunk,
+                            'more_body': True
+                        })
                 await send({
                     'type': 'http.response.body',
-                    'body': resp_body
+                    'body': b'',
+                    'more_body': False
                 })
 
                 return
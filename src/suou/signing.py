@@ -15,6 +15,7 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 """
 
 from abc import ABC
+from functools import lru_cache
 from typing import Any, Callable, Sequence
 import warnings
 from itsdangerous import TimestampSigner
@@ -22,34 +23,47 @@ from itsdangerous import TimestampSigner
 from itsdangerous import Signer as _Signer
 from itsdangerous.encoding import int_to_bytes as _int_to_bytes
 
-from .itertools import rtuple
-from .codecs import jsondecode, jsonencode, want_bytes, want_str, b64decode, b64encode
+from .codecs import jsondecode, jsonencode, want_bytes, want_str, b64encode, b64decode_lax
 from .iding import Siq
 from .classtools import MISSING
 
+@lru_cache(maxsize=256)
+def _split_token(token: bytes) -> tuple[bytes, int, bytes]:
+    # same tokens come back on every request (i.e. cookies): parse each once
+    a, b, c = token.rsplit(b'.', 2)
+    return (
+        b64decode_lax(a),
+        int.from_bytes(b64decode_lax(b), 'big'),
+        b64decode_lax(c)
+    )
+
 class UserSigner(TimestampSigner):
     """
     itsdangerous.TimestampSigner() instanced from a user ID, with token generation and validation capabilities.
     """
     user_id: int
+    _uid_b64: bytes
     def __init__(self, master_secret: bytes, user_id: int, user_secret: bytes, **kwargs):
-        super().__init__(master_secret + user_secret, salt=Siq(user_id).to_bytes(), **kwargs)
+        siq = Siq(user_id)
+        super().__init__(master_secret + user_secret, salt=siq.to_bytes(), **kwargs)
         self.user_id = user_id
+        # token payload never changes, just like the salt
+        self._uid_b64 = siq.to_base64().encode('ascii')
     def token(self, *, test_timestamp=MISSING) -> str:
-        payload = Siq(self.user_id).to_base64()
+        payload = self._uid_b64
         ## The following is not intended for general use
         if test_timestamp is not MISSING:
             warnings.warn('timestamp= parameter is intended for testing only!\n\x1b[31mDO NOT use it in production or you might get consequences\x1b[0m, just saying', UserWarning)
-            ts_payload = b64encode(_int_to_bytes(test_timestamp))
-            payload = want_bytes(payload) + want_bytes(self.sep) + want_bytes(ts_payload)
+            ts_payload = b64encode(_int_to_bytes(test_timestamp)).encode('ascii')
+            # bytes throughout, self.sep included
+            payload = payload + self.sep + ts_payload
             return want_str(_Signer.sign(self, payload))
         ## END the following is not intended for general use
         
         return want_str(self.sign(payload))
     @classmethod
     def split_token(cls, /, token: str | bytes) :
-        a, b, c = want_str(token).rsplit('.', 2)
-        return b64decode(a), int.from_bytes(b64decode(b), 'big'), b64decode(c)
+        return _split_token(want_bytes(token))
     def sign_object(self, obj: dict, /, *, encoder=jsonencode, **kwargs):
         """
         Return a signed JSON payload of an object.
@@ -63,7 +77,15 @@ class UserSigner(TimestampSigner):
         """
         return decoder(self.unsign(payload, **kwargs))
     def split_signed(self, payload: str | bytes) -> Sequence[bytes]:
-        return rtuple(want_bytes(payload).rsplit(b'.', 2), 3, b'')
+        # same as rtuple(b.rsplit(b'.', 2), 3, b''), without the intermediate list
+        b = want_bytes(payload)
+        i2 = b.rfind(b'.')
+        if i2 < 0:
+            return (b'', b'', b)
+        i1 = b.rfind(b'.', 0, i2)
+        if i1 < 0:
+            return (b'', b[:i2], b[i2 + 1:])
+        return (b[:i1], b[i1 + 1:i2], b[i2 + 1:])
 
 class HasSigner(ABC):
     '''
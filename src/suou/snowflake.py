@@ -25,7 +25,7 @@ import enum
 import os
 from threading import Lock
 import time
-from typing import override
+from typing import Callable, override
 import warnings
 
 from .migrate import SnowflakeSiqMigrator
@@ -57,11 +57,16 @@ class SnowflakeGen:
     Jan 1, 2015 for Discord); epoch is wanted as seconds since Unix epoch 
     (i.e. midnight of Jan 1, 1970).
     """
+    __slots__ = ('epoch', 'local_id', 'shard_id', 'counter', 'last_gen_ts', '_lock', '_epoch_ts', '_ns_per_tick', '__weakref__')
+
     epoch: int
     local_id: int
     shard_id: int
     counter: int
     last_gen_ts: int
+    _lock: Lock
+    _epoch_ts: int
+    _ns_per_tick: int
 
     TS_ACCURACY = 1000
 
@@ -70,12 +75,30 @@ class SnowflakeGen:
         last_id: int = 0
     ):
         self.epoch = epoch
+        # cur_timestamp() works in integer ticks, no float math
+        self._epoch_ts = int(epoch * self.TS_ACCURACY)
+        self._ns_per_tick = 1_000_000_000 // self.TS_ACCURACY
         self.local_id = local_id
         self.shard_id = (shard_id or os.getpid()) % 32
         self.counter = 0
         self.last_gen_ts = min(last_id >> 22, self.cur_timestamp())
+        self._lock = Lock()
     def cur_timestamp(self) -> int:
-        return int((time.time() - self.epoch) * self.TS_ACCURACY)
+        return time.time_ns() // self._ns_per_tick - self._epoch_ts
+    def _sleep_until(self, ts: int, /) -> None:
+        """
+        Sleep until the given tick begins.
+        """
+        delay = (ts + self._epoch_ts) * self._ns_per_tick - time.time_ns()
+        if delay > 0:
+            time.sleep(delay / 1_000_000_000)
+    def _cur_timestamp_after(self, ts: int, /) -> int:
+        """
+        Return the current timestamp, once it has reached the given tick.
+        """
+        while (now := self.cur_timestamp()) < ts:
+            self._sleep_until(ts)
+        return now
     def generate(self, /, n: int = 1):
         """
         Generate one or more snowflakes.
@@ -87,63 +110,93 @@ class SnowflakeGen:
         .generate_list() or list(.generate()), respectively.
 
         Warning: the function **may block**.
+
+        *Changed in 0.14.0*: waits for the next tick in one sleep, instead of polling
         """
-        now = self.cur_timestamp()
-        if now < self.last_gen_ts:
-            time.sleep((self.last_gen_ts - now) / (1 << 16))
-        elif now > self.last_gen_ts:
-            self.counter = 0
+        # the clock may have gone backwards
+        now = self._cur_timestamp_after(self.last_gen_ts)
+        tail = ((self.local_id % 32) << 17) | ((self.shard_id % 32) << 12)
         while n:
-            if self.counter >= 4096:
-                while (now := self.cur_timestamp()) <= self.last_gen_ts:
-                    time.sleep(1 / (1 << 16))
-                with Lock():
-                    self.counter %= 1 << 16
             # XXX the lock is here "just in case", MULTITHREADED GENERATION IS NOT ADVISED!
-            with Lock():
-                siq = (
-                    (now << 22) | 
-                    ((self.local_id % 32) << 17) |
-                    ((self.shard_id % 32) << 12) |
-                    (self.counter % (1 << 12))
-                ) 
-                n -= 1
-                self.counter += 1
-            yield siq
+            # reserve as many IDs as fit in the current tick, then emit them with no checks
+            with self._lock:
+                if now > self.last_gen_ts:
+                    self.last_gen_ts = now
+                    self.counter = 0
+                start = self.counter
+                room = min(n, 4096 - start)
+                self.counter = start + room
+            if room <= 0:
+                # counter exhausted: wait for the next tick
+                now = self._cur_timestamp_after(self.last_gen_ts + 1)
+                continue
+            n -= room
+            base = (now << 22) | tail
+            for c in range(start, start + room):
+                yield base | c
     def generate_one(self, /) -> int:
         return next(self.generate(1))
     def generate_list(self, /, n: int = 1) -> list[int]:
-        return list(self.generate(n))
+        """
+        Syntactic sugar for list(.generate()).
 
+        *Changed in 0.14.0*: bulk requests skip the per-ID generator loop
+        """
+        if n > 4:
+            return self._generate_bulk(n)
+        return list(self.generate(n))
+    def _generate_bulk(self, /, n: int) -> list[int]:
+        """
+        Same as list(.generate()), but builds the whole batch at once
+        as long as the counter does not wrap around within it.
+        """
+        now = self._cur_timestamp_after(self.last_gen_ts)
+        with self._lock:
+            if now > self.last_gen_ts:
+                self.last_gen_ts = now
+                self.counter = 0
+            start = self.counter
+            if start + n <= 4096:
+                self.counter = start + n
+        if start + n > 4096:
+            # counter would overflow mid-batch, let generate() wait for the next tick
+            return list(self.generate(n))
+        base = (now << 22) | ((self.local_id % 32) << 17) | ((self.shard_id % 32) << 12)
+        return [base | c for c in range(start, start + n)]
 
 class Snowflake(int):
     """
     Representation of a Snowflake as an integer.
     """
-    
+    __slots__ = ()
+
     def to_bytes(self, length: int = 14, byteorder = "big", *, signed: bool = False) -> bytes:
         return super().to_bytes(length, byteorder, signed=signed)
     @classmethod
     def from_bytes(cls, b: bytes, byteorder = 'big', *, signed: bool = False) -> Snowflake:
-        if len(b) not in (8, 10):
+        # 9 and 10 bytes are what .to_base64() and .to_b32l() pad to; skipped under -O
+        if __debug__ and len(b) not in (8, 9, 10):
             warnings.warn('Snowflakes are exactly 8 bytes long', BytesWarning)
         return super().from_bytes(b, byteorder, signed=signed)
     
+    # int.to_bytes() and int.__format__() below are called directly,
+    # skipping the overrides in this class
+
     def to_base64(self, length: int = 9, *, strip: bool = True) -> str:
-        return b64encode(self.to_bytes(length), strip=strip)
+        return b64encode(int.to_bytes(self, length, 'big'), strip=strip)
     @classmethod
     def from_base64(cls, val:str) -> Snowflake:
         return Snowflake.from_bytes(b64decode(val))
     
     def to_cb32(self)-> str:
-        return cb32encode(self.to_bytes(8, 'big'))
+        return cb32encode(int.to_bytes(self, 8, 'big'))
     to_crockford = to_cb32
     @classmethod
     def from_cb32(cls, val:str) -> Snowflake:
         return Snowflake.from_bytes(cb32decode(val))
 
     def to_hex(self) -> str:
-        return f'{self:x}'
+        return int.__format__(self, 'x')
     @classmethod
     def from_hex(cls, val:str) -> Snowflake:
         if val.startswith('_'):
@@ -151,7 +204,7 @@ class Snowflake(int):
         return Snowflake.from_bytes(unhexlify(val))
 
     def to_oct(self) -> str:
-        return f'{self:o}'
+        return int.__format__(self, 'o')
     @classmethod
     def from_oct(cls, val:str) -> Snowflake:
         if val.startswith('_'):
@@ -162,7 +215,7 @@ class Snowflake(int):
         # PSA Snowflake Base32 representations are padded to 10 bytes!
         if self < 0:
             return '_' + Snowflake.to_b32l(-self)
-        return b32lencode(self.to_bytes(10, 'big')).lstrip('a')
+        return b32lencode(int.to_bytes(self, 10, 'big')).lstrip('a')
     @classmethod
     def from_b32l(cls, val: str) -> Snowflake:
         if val.startswith('_'):
@@ -180,26 +233,31 @@ class Snowflake(int):
 
     @override
     def __format__(self, opt: str, /) -> str:
-        try:
-            return self.format(opt)
-        except ValueError:
-            return super().__format__(opt)
+        fn = self._FORMATTERS.get(opt)
+        if fn is not None:
+            try:
+                return fn(self)
+            except ValueError:
+                pass
+        return super().__format__(opt)
     def format(self, opt: str, /) -> str:
-        match opt:
-            case 'b':
-                return self.to_base64()
-            case 'c':
-                return self.to_cb32()
-            case '0c':
-                return '0' + self.to_cb32()
-            case 'd' | '':
-                return int.__repr__(self)
-            case 'l':
-                return self.to_b32l()
-            case 'o' | 'x':
-                return int.__format__(self, opt)
-            case _:
-                raise ValueError(f'unknown format: {opt!r}')
+        try:
+            fn = self._FORMATTERS[opt]
+        except KeyError:
+            raise ValueError(f'unknown format: {opt!r}') from None
+        return fn(self)
+
+    # option -> formatter, used by format() and __format__()
+    _FORMATTERS: dict[str, Callable[[Snowflake], str]] = {
+        'b': to_base64,
+        'c': to_cb32,
+        '0c': lambda self: '0' + self.to_cb32(),
+        'd': int.__repr__,
+        '': int.__repr__,
+        'l': to_b32l,
+        'o': to_oct,
+        'x': to_hex,
+    }
     
     def __str__(self) -> str:
         return int.__str__(self)
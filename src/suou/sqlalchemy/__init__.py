@@ -18,6 +18,7 @@ from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
 from functools import wraps
+from operator import attrgetter
 from typing import Callable, Iterable, Never, TypeVar
 from sqlalchemy import LargeBinary, Column, create_engine, select
 from sqlalchemy.orm import DeclarativeBase, Session
@@ -58,22 +59,30 @@ def token_signer(id_attr: Column | str, secret_attr: Column | str) -> Incomplete
 
     Requires a master secret (taken from Base.metadata), a user id (visible in the token)
     and a user secret.
+
+    *Changed in 0.14.0*: column accessors are resolved once, when the class is created
     """
-    id_val: Column | Wanted[Column]
-    if isinstance(id_attr, Column):
-        id_val = id_attr
-    elif isinstance(id_attr, str):
-        id_val = Wanted(id_attr)
-    if isinstance(secret_attr, Column):
-        secret_val = secret_attr
-    elif isinstance(secret_attr, str):
-        secret_val = Wanted(secret_attr)
+    def attr_name(owner: DeclarativeBase, attr: Column | str) -> str:
+        if isinstance(attr, str):
+            return attr
+        # columns are named by declarative later on, look them up in the class body instead
+        for k, v in vars(owner).items():
+            if v is attr:
+                return k
+        if attr.key is None:
+            # declarative may have replaced the column already, and an unnamed one can't be found
+            raise ValueError(f'cannot find column {attr!r} in {owner.__name__}, pass its name as a string instead')
+        return attr.key
     def token_signer_factory(owner: DeclarativeBase, name: str):
+        # accessors are resolved once per class, not on every call
+        id_getter = attrgetter(attr_name(owner, id_attr))
+        secret_getter = attrgetter(attr_name(owner, secret_attr))
         def my_signer(self):
-            return UserSigner(
-                owner.metadata.info['secret_key'], 
-                id_val.__get__(self, owner), secret_val.__get__(self, owner)  # pyright: ignore[reportAttributeAccessIssue]
-            )
+            user_id = id_getter(self)
+            if isinstance(user_id, bytes):
+                # SIQ columns (IdType) hold bytes
+                user_id = int.from_bytes(user_id, 'big')
+            return UserSigner(owner.metadata.info['secret_key'], user_id, secret_getter(self))
         my_signer.__name__ = name
         return my_signer
     return Incomplete(Wanted(token_signer_factory))
@@ -116,21 +125,33 @@ def require_auth_base(cls: type[DeclarativeBase], *, src: AuthSrc, column: str |
     Inject the current user into a view, given the Authorization: Bearer header.
 
     For portability reasons, this is a partial, two-component function, requiring a AuthSrc() object.
+
+    Malformed tokens are rejected before querying the database.
     '''
     col = want_column(cls, column)
-    validators = makelist(validators)
+    # messages are looked up once, not on every request
+    validators = tuple((valid, getattr(valid, 'message', 'validation failed')) for valid in makelist(validators))
 
     def get_user(token) -> DeclarativeBase:
         if token is None:
             return None
-        tok_parts = UserSigner.split_token(token)
-        user: HasSigner = src.get_session().execute(select(cls).where(col == tok_parts[0])).scalar()
+        try:
+            user_id, _, sig = UserSigner.split_token(token)
+        except ValueError:
+            # malformed token, don't even hit the database
+            return None
+        user: HasSigner = src.get_session().execute(select(cls).where(col == user_id)).scalar()
+        if user is None:
+            return None
         try:
             signer: UserSigner = user.signer()
+            # a signature of the wrong length can be rejected without computing the HMAC
+            if len(sig) != signer.digest_method().digest_size:
+                return None
             signer.unsign(token)
-            return user
         except Exception:
             return None
+        return user
 
     def _default_invalid(msg: str = 'Validation failed'):
         raise ValueError(msg)
@@ -146,9 +167,9 @@ def require_auth_base(cls: type[DeclarativeBase], *, src: AuthSrc, column: str |
                 required_exc()
             if signed:
                 ka[sig_dest] = src.get_signature()
-            for valid in validators:
+            for valid, msg in validators:
                 if not valid(ka[dest]):
-                    invalid_exc(getattr(valid, 'message', 'validation failed').format(user=ka[dest]))
+                    invalid_exc(msg.format(user=ka[dest]))
             return func(*a, **ka)
         return wrapper
     return decorator
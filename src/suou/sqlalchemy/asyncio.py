@@ -18,13 +18,15 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 """
 
 from __future__ import annotations
-from functools import wraps
+import asyncio
+from functools import lru_cache, wraps
 
 from contextvars import ContextVar, Token
 from typing import Callable, TypeVar
-from sqlalchemy import Select, Table, select
+from sqlalchemy import Select, Table, bindparam, make_url, select
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 try:
     from .quart import AsyncSelectPagination
@@ -36,6 +38,26 @@ from ..exceptions import NotFoundError
 _T = TypeVar('_T')
 _U = TypeVar('_U')
 
+def _engine_kwargs(url: str, kwargs: dict) -> dict:
+    """
+    Defaults for create_async_engine(), as applied by SQLAlchemy.bind().
+    """
+    kwargs = dict(kwargs)
+    kwargs.setdefault('query_cache_size', 1200)
+    kwargs.setdefault('pool_pre_ping', True)
+    kwargs.setdefault('pool_recycle', 1800)
+    poolclass = kwargs.get('poolclass')
+    if poolclass is None:
+        # SQLite pools don't take a size
+        sized = make_url(url).get_backend_name() != 'sqlite'
+    else:
+        # e.g. NullPool doesn't either
+        sized = issubclass(poolclass, QueuePool)
+    if sized:
+        kwargs.setdefault('pool_size', 20)
+        kwargs.setdefault('max_overflow', 40)
+    return kwargs
+
 class SQLAlchemy:
     """
     Drop-in (in fact, almost) replacement for flask_sqlalchemy.SQLAlchemy()
@@ -58,12 +80,18 @@ class SQLAlchemy:
     now sessions are stored as context variables
 
     *Changed in 0.11.0*: sessions are now wrapped by default; turn it off by instantiating it with wrap=False
+
+    *Changed in 0.14.0*: nested sessions are closed in the right order
+
+    *Changed in 0.14.0*: .bind() passes keyword arguments to create_async_engine(), with larger pool and query cache;
+    sessions come from an async_sessionmaker() made once per engine
     """
     base: DeclarativeBase
     engine: AsyncEngine
     _session_tok: list[Token[AsyncSession]]
     _wrapsessions: bool | None
     _xocommit: bool | None
+    _smaker: async_sessionmaker[AsyncSession] | None
     NotFound = NotFoundError
 
     def __init__(self, model_class: DeclarativeBase, *, expire_on_commit = False, wrap = True):
@@ -71,28 +99,42 @@ class SQLAlchemy:
         self.engine = None
         self._wrapsessions = wrap
         self._xocommit = expire_on_commit
-    def bind(self, url: str):
-        self.engine = create_async_engine(url)
+        self._smaker = None
+    def bind(self, url: str, **kwargs):
+        """
+        Create the engine. Keyword arguments are passed to create_async_engine().
+
+        Unless given, the connection pool is larger than SQLAlchemy's default,
+        and connections are checked before use and recycled every 30 minutes.
+        """
+        self.engine = create_async_engine(url, **_engine_kwargs(url, kwargs))
+        self._smaker = async_sessionmaker(self.engine, expire_on_commit=self._xocommit)
     def _ensure_engine(self):
         if self.engine is None:
             raise RuntimeError('database is not connected')
     async def begin(self, *, expire_on_commit = None, wrap = None, **kw) -> AsyncSession:
         self._ensure_engine()
+        if self._smaker is None or self._smaker.kw['bind'] is not self.engine:
+            # .engine was assigned directly
+            self._smaker = async_sessionmaker(self.engine, expire_on_commit=self._xocommit)
         ## XXX is it accurate?
-        s = AsyncSession(self.engine, 
-            expire_on_commit=expire_on_commit if expire_on_commit is not None else self._xocommit,
-            **kw)
+        if expire_on_commit is not None:
+            kw['expire_on_commit'] = expire_on_commit
+        s = self._smaker(**kw)
         if (wrap if wrap is not None else self._wrapsessions):
             s = SessionWrapper(s)
-        current_session.set(s)
+        # one stack per context, so that nested and concurrent sessions don't clash
+        current_session.set(current_session.get() + (s,))
         return s
     async def __aenter__(self) -> AsyncSession:
         return await self.begin()
     async def __aexit__(self, e1, e2, e3):
         ## XXX is it accurate?
-        s = current_session.get()
-        if not s:
+        stack = current_session.get()
+        if not stack:
             raise RuntimeError('session not closed')
+        s = stack[-1]
+        current_session.set(stack[:-1])
         if e1:
             await s.rollback()
         else:
@@ -126,7 +168,7 @@ class SQLAlchemy:
         )
 
 
-current_session: ContextVar[AsyncSession] = ContextVar('current_session')
+current_session: ContextVar[tuple[AsyncSession, ...]] = ContextVar('current_session', default=())
 """
 XXX NOT public API! DO NOT USE
 """
@@ -148,6 +190,12 @@ def async_query(db: SQLAlchemy, multi: False):
     return decorator
 
 
+@lru_cache(maxsize=256)
+def _by_id_stmt(table: Table) -> Select:
+    # built once per table, the key is passed as a parameter
+    return select(table).where(table.id == bindparam('pk'))  # pyright: ignore[reportAttributeAccessIssue]
+
+
 class SessionWrapper:
     """
     Wrap a SQLAlchemy() session (context manager) adding several QoL utilitites.
@@ -159,30 +207,70 @@ class SessionWrapper:
     This works in async context; DO NOT USE with regular SQLAlchemy.
 
     NEW 0.6.0
+
+    *Changed in 0.14.0*: the most used session methods are delegated explicitly, instead of going through __getattr__()
     """
+    __slots__ = ('_wrapped', '_cached_session')
+
+    _wrapped: SQLAlchemy | AsyncSession
+    _cached_session: AsyncSession | None
 
     def __init__(self, db_or_session: SQLAlchemy | AsyncSession):
         self._wrapped = db_or_session
+        self._cached_session = db_or_session if isinstance(db_or_session, AsyncSession) else None
     async def __aenter__(self):
         if isinstance(self._wrapped, SQLAlchemy):
-            self._wrapped = await self._wrapped.begin()
+            # keep the SQLAlchemy() around, its __aexit__() commits the session
+            self._cached_session = await self._wrapped.begin(wrap=False)
         return self
     
     async def __aexit__(self, *exc_info):
-        await self._wrapped.__aexit__(*exc_info)
+        try:
+            await self._wrapped.__aexit__(*exc_info)
+        finally:
+            if isinstance(self._wrapped, SQLAlchemy):
+                # the session is closed now, don't hand it out anymore
+                self._cached_session = None
 
     @property
-    def _session(self):
-        if isinstance(self._wrapped, AsyncSession):
-            return self._wrapped
-        raise RuntimeError('active session is required')
+    def _session(self) -> AsyncSession:
+        s = self._cached_session
+        if s is None:
+            raise RuntimeError('active session is required')
+        return s
+
+    ## Awaitables are handed back as they are, no need for another coroutine frame
+
+    def execute(self, *args, **kwargs):
+        return self._session.execute(*args, **kwargs)
+    def scalar(self, *args, **kwargs):
+        return self._session.scalar(*args, **kwargs)
+    def scalars(self, *args, **kwargs):
+        return self._session.scalars(*args, **kwargs)
+    def get(self, *args, **kwargs):
+        return self._session.get(*args, **kwargs)
+    def add(self, *args, **kwargs):
+        return self._session.add(*args, **kwargs)
+    def add_all(self, *args, **kwargs):
+        return self._session.add_all(*args, **kwargs)
+    def delete(self, *args, **kwargs):
+        return self._session.delete(*args, **kwargs)
+    def flush(self, *args, **kwargs):
+        return self._session.flush(*args, **kwargs)
+    def commit(self):
+        return self._session.commit()
+    def rollback(self):
+        return self._session.rollback()
+    def close(self):
+        return self._session.close()
     
     async def get_one(self, query: Select):
         result = await self._session.execute(query)
         return result.scalar()
 
     async def get_by_id(self, table: Table, key) :
-        return await self.get_one(select(table).where(table.id == key))  # pyright: ignore[reportAttributeAccessIssue]
+        result = await self._session.execute(_by_id_stmt(table), {'pk': key})
+        return result.scalar()
 
     async def get_list(self, query: Select, limit: int | None = None):
         if limit:
@@ -197,7 +285,15 @@ class SessionWrapper:
         return getattr(self._session, key)
 
     def __del__(self):
-        self._session.close()
+        s = getattr(self, '_cached_session', None)
+        if s is None:
+            return
+        # close() is a coroutine: it can only be scheduled, and only inside a running loop
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        loop.create_task(s.close())
 
 
 
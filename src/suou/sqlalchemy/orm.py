@@ -18,6 +18,7 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 
 
 
+from functools import lru_cache
 import os
 import re
 from typing import Any, Callable, TypeAlias, TypeVar
@@ -29,7 +30,7 @@ from sqlalchemy.ext.hybrid import Comparator
 from suou.bits import i4_to_int, int_to_i4
 from suou.classtools import Wanted, Incomplete
 from suou.codecs import StringCase
-from suou.iding import Siq, SiqCache, SiqGen, SiqType
+from suou.iding import SiqCache, SiqGen, SiqType
 from suou.itertools import kwargs_prefix
 from suou.snowflake import SnowflakeGen
 from suou.sqlalchemy import IdType
@@ -54,15 +55,32 @@ def want_column(cls: type[DeclarativeBase], col: Column[_T] | str) -> Column[_T]
         raise TypeError
 
 
+@lru_cache(maxsize=None)
+def _siq_cache(domain_name: str, typ: SiqType) -> SiqCache:
+    """
+    One SiqCache per domain and type, shared by every column of that type.
+    """
+    return SiqCache(SiqGen(domain_name), typ)
+
+@lru_cache(maxsize=None)
+def _snowflake_gen(epoch: int) -> SnowflakeGen:
+    """
+    One SnowflakeGen per epoch, shared by every snowflake column.
+    """
+    return SnowflakeGen(epoch)
+
 def id_column(typ: SiqType, *, primary_key: bool = True, **kwargs):
     """
     Marks a column which contains a SIQ.
+
+    *Changed in 0.14.0*: columns of the same type and domain share one ID cache
     """
     def new_id_factory(owner: DeclarativeBase) -> Callable:
         domain_name = owner.metadata.info['domain_name']
-        idgen = SiqCache(SiqGen(domain_name), typ)
-        def new_id() -> bytes:
-            return Siq(idgen.generate()).to_bytes()
+        generate = _siq_cache(domain_name, typ).generate
+        # taking the execution context makes SQLAlchemy call this directly, unwrapped
+        def new_id(context) -> bytes:
+            return int.to_bytes(generate(), 14, 'big')
         return new_id
     if primary_key:
         return Incomplete(Column, IdType, primary_key = True, default = Wanted(new_id_factory), **kwargs)
@@ -72,13 +90,15 @@ def id_column(typ: SiqType, *, primary_key: bool = True, **kwargs):
 def snowflake_column(*, primary_key: bool = True, **kwargs):
     """
     Same as id_column() but with snowflakes.
+
+    *Changed in 0.14.0*: columns with the same epoch share one generator
     """
     def new_id_factory(owner: DeclarativeBase) -> Callable:
         epoch = owner.metadata.info['snowflake_epoch']
         # more arguments will be passed on (?)
-        idgen = SnowflakeGen(epoch)
-        def new_id() -> int:
-            return idgen.generate_one()
+        generate_one = _snowflake_gen(epoch).generate_one
+        def new_id(context) -> int:
+            return generate_one()
         return new_id
     if primary_key:
         return Incomplete(Column, BigInteger, primary_key = True, default = Wanted(new_id_factory), **kwargs)
@@ -90,9 +110,19 @@ def match_constraint(col_name: str, regex: str, /, dialect: str = 'default', con
     """
     Shorthand for a check constraint. Several dialects are supported.
     """
-    return CheckConstraint(text(match_constraint.TEXT_DIALECTS.get(dialect, match_constraint.TEXT_DIALECTS['default'])).bindparams(n=col_name, re=regex),
+    return CheckConstraint(_match_clause(match_constraint.TEXT_DIALECTS.get(dialect, match_constraint.TEXT_DIALECTS['default']), col_name, regex),
             name=constraint_name)
 
+@lru_cache(maxsize=None)
+def _match_text(template: str):
+    # parsed once per template; .bindparams() below makes a copy
+    return text(template)
+
+@lru_cache(maxsize=256)
+def _match_clause(template: str, col_name: str, regex: str):
+    # keyed on the template itself, so that changes to TEXT_DIALECTS are honored
+    return _match_text(template).bindparams(n=col_name, re=regex)
+
 match_constraint.TEXT_DIALECTS = {
     'default': ':n ~ :re',
     'postgresql': ':n ~ :re',
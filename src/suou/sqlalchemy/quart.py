@@ -27,18 +27,43 @@ class AsyncSelectPagination(Pagination):
     flask_sqlalchemy.SelectPagination but asynchronous.
 
     Pagination is not part of the public API, therefore expect that it may break
+
+    *Changed in 0.14.0*: items and total count are fetched in one query, where possible
     """
 
+    @staticmethod
+    def _can_count_over(select_q: Select) -> bool:
+        """
+        Whether COUNT(*) OVER () gives the same total as the separate count query.
+
+        XXX relies on private Select attributes; a SQLAlchemy upgrade may break this
+        """
+        # COUNT(*) OVER () counts rows before DISTINCT, GROUP BY and the query's own LIMIT
+        return (isinstance(select_q, Select) and not select_q._group_by_clauses and not select_q._distinct
+            and select_q._limit_clause is None and select_q._offset_clause is None)
+
     async def _query_items(self) -> list:
         select_q: Select = self._query_args["select"]
-        select = select_q.limit(self.per_page).offset(self._query_offset)
         session: AsyncSession = self._query_args["session"]
+        if self.has_count and self._can_count_over(select_q):
+            select = select_q.add_columns(func.count().over().label("__total")).limit(self.per_page).offset(self._query_offset)
+            rows = (await session.execute(select)).all()
+            if rows:
+                self.total = rows[0][-1]
+            return [row[0] for row in rows]
+        select = select_q.limit(self.per_page).offset(self._query_offset)
         out = (await session.execute(select)).scalars()
         return out
 
     async def _query_count(self) -> int:
         select_q: Select = self._query_args["select"]
-        sub = select_q.options(lazyload("*")).order_by(None).subquery()
+        if select_q._distinct:
+            # narrowing the columns would change what DISTINCT compares
+            inner = select_q.options(lazyload("*"))
+        else:
+            # one column is enough to count rows; dropping the entities drops eager loads as well
+            inner = select_q.with_only_columns(*select_q.selected_columns[:1], maintain_column_froms=True)
+        sub = inner.order_by(None).subquery()
         session: AsyncSession = self._query_args["session"]
         out = (await session.execute(select(func.count()).select_from(sub))).scalar()
         return out
@@ -80,7 +105,7 @@ class AsyncSelectPagination(Pagination):
             raise RuntimeError('query returned None')
         if not self.items and self.page != 1 and self.error_out:
             raise self.error_out
-        if self.has_count:
+        if self.has_count and self.total is None:
             self.total = await self._query_count()
         for i in self.items:
             yield i
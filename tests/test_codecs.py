@@ -2,7 +2,7 @@
 
 import binascii
 import unittest
-from suou.codecs import b64encode, b64decode, want_urlsafe, z85decode
+from suou.codecs import b64encode, b64decode, b64decode_lax, want_urlsafe, z85decode
 
 B1 = b'N\xf0\xb4\xc3\x85\n\xf9\xb6\x9a\x0f\x82\xa6\x99G\x07#'
 B2 = b'\xbcXiF,@|{\xbe\xe3\x0cz\xa8\xcbQ\x82'
@@ -44,6 +44,12 @@ class TestCodecs(unittest.TestCase):
 
         self.assertRaises(binascii.Error, b64decode, 'C')
 
+    def test_b64decode_lax(self):
+        self.assertEqual(b64decode_lax(b'TvC0w4UK-baaD4KmmUcHIw'), B1)
+        self.assertEqual(b64decode_lax(b'TvC0ww=='), B1[:4])
+        self.assertEqual(b64decode_lax(b'//init//'), B5)
+        self.assertEqual(b64decode_lax(b''), b'')
+
     def test_want_urlsafe(self):
         self.assertEqual('__init__', want_urlsafe('//init_/'))
         self.assertEqual('Disney-', want_urlsafe('Disney+'))
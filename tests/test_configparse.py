@@ -0,0 +1,59 @@
+
+
+from configparser import ConfigParser
+import unittest
+
+from suou.configparse import ConfigOptions, ConfigParserConfigSource, ConfigValue, DictConfigSource
+
+
+class Options(ConfigOptions):
+    name = ConfigValue(preserve_case=True, default='nobody')
+    port = ConfigValue(preserve_case=True, cast=int, default='80')
+    user = ConfigValue(preserve_case=True, extra_src='login')
+    site_name = ConfigValue(preserve_case=True, default='Example', public=True)
+    lang = ConfigValue(preserve_case=True, default='en', public='default_lang')
+
+
+class TestConfigparse(unittest.TestCase):
+    def setUp(self) -> None:
+        self.opts = Options()
+        self.opts.add_source('default', DictConfigSource({'name': 'alice', 'port': '8080'}))
+
+    def tearDown(self) -> None:
+        ...
+
+    def test_get(self):
+        self.assertEqual(self.opts.name, 'alice')
+        self.assertEqual(self.opts.port, 8080)
+
+    def test_per_instance(self):
+        other = Options()
+        other.add_source('default', DictConfigSource({'name': 'bob'}))
+        self.assertEqual(self.opts.name, 'alice')
+        self.assertEqual(other.name, 'bob')
+        self.assertEqual(other.port, 80)
+
+    def test_invalidate(self):
+        d = {'name': 'alice', 'user': 'alice'}
+        opts = Options()
+        opts.add_source('default', DictConfigSource(d))
+        self.assertEqual(opts.name, 'alice')
+        d['name'] = 'carol'
+        self.assertEqual(opts.name, 'alice')
+        opts.invalidate('name')
+        self.assertEqual(opts.name, 'carol')
+        self.assertEqual(opts.user, 'alice')
+        opts.add_source('extra', DictConfigSource({'login': 'dave'}), first=True)
+        self.assertEqual(opts.user, 'dave')
+
+    def test_configparser_len(self):
+        cfp = ConfigParser()
+        cfp.read_string('[server]\nhost = localhost\nport = 8080\n[database]\nurl = sqlite://\n')
+        src = ConfigParserConfigSource(cfp)
+        self.assertEqual(len(src), 3)
+        self.assertEqual(len(src), len(list(src)))
+
+    def test_to_dict(self):
+        self.assertEqual(self.opts.to_dict(), {'site_name': 'Example', 'default_lang': 'en'})
+        self.opts.expose('port')
+        self.assertEqual(self.opts.to_dict(), {'site_name': 'Example', 'default_lang': 'en', 'port': 8080})
@@ -0,0 +1,59 @@
+
+
+import json
+import os
+import tempfile
+import unittest
+
+from suou.i18n import I18nLang, JsonI18n
+
+
+class TestI18n(unittest.TestCase):
+    def setUp(self) -> None:
+        self.en = I18nLang({'hello': 'Hello, {name}!', 'bye': 'Goodbye'})
+        self.it = I18nLang({'hello': 'Ciao, {name}!'})
+        self.it.add_fallback(self.en)
+
+    def tearDown(self) -> None:
+        ...
+
+    def test_t(self):
+        self.assertEqual(self.it.t('hello', name='Mario'), 'Ciao, Mario!')
+        self.assertEqual(self.it.t('bye'), 'Goodbye')
+        self.assertEqual(self.it.t('missing'), 'missing')
+        self.assertEqual(self.it.t('{0} and {1}', 'A', 'B'), 'A and B')
+
+    def test_t_unhashable(self):
+        self.assertEqual(self.en.t('{0[0]}', ['x']), 'x')
+
+    def test_t_equal_args(self):
+        lang = I18nLang({'n': 'value: {0}'})
+        self.assertEqual(lang.t('n', 1.0), 'value: 1.0')
+        self.assertEqual(lang.t('n', True), 'value: True')
+
+    def test_t_update(self):
+        self.assertEqual(self.it.t('bye'), 'Goodbye')
+        self.it.update({'bye': 'Arrivederci'})
+        self.assertEqual(self.it.t('bye'), 'Arrivederci')
+
+    def test_load_file_cache(self):
+        with tempfile.TemporaryDirectory() as root:
+            with open(os.path.join(root, 'strings.en.json'), 'w') as f:
+                json.dump({'hello': 'Hello'}, f)
+            i18n = JsonI18n(root)
+            d1 = i18n.load_file('strings.en.json')
+            with self.assertRaises(TypeError):
+                d1['hello'] = 'Changed'
+            d2 = JsonI18n(root).load_file('strings.en.json')
+            self.assertIs(d1, d2)
+            self.assertEqual(d2, {'hello': 'Hello'})
+            self.assertEqual(i18n.lang('en').t('hello'), 'Hello')
+
+    def test_fallback_update(self):
+        de = I18nLang({'hello': 'Hallo, {name}!'})
+        de.add_fallback(self.it)
+        self.assertEqual(de.t('bye'), 'Goodbye')
+        self.en.update({'bye': 'Bye', 'thanks': 'Thanks'})
+        self.assertEqual(de.t('bye'), 'Bye')
+        self.assertEqual(self.it.t('thanks'), 'Thanks')
+        self.assertEqual(de.t('hello', name='Hans'), 'Hallo, Hans!')
@@ -32,4 +32,7 @@ class TestIding(unittest.TestCase):
     def test_representation(self):
         i1 = Siq(7451106619238957490390643507207)
         self.assertEqual(i1.to_hex(), "5e0bd2f0000000000000000007")
-        self.assertEqual(i1.to_did(), "did:siq:iuxvojaaf4c6s6aaaaaaaaaaaaaah")
\ No newline at end of file
+        self.assertEqual(i1.to_did(), "did:siq:iuxvojaaf4c6s6aaaaaaaaaaaaaah")
+        self.assertEqual(Siq.from_did(i1.to_did()), i1)
+        self.assertEqual(Siq.from_cb32(i1.to_cb32()), i1)
+        self.assertEqual(i1.to_b32l(), "aaaf4c6s6aaaaaaaaaaaaaah")
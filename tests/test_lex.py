@@ -0,0 +1,50 @@
+
+
+import unittest
+
+from suou.exceptions import LexError
+from suou.lex import TokenSym, lex, symbol_table
+
+
+class TestLex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.table = symbol_table(
+            (r'\d+', 'num', int),
+            (r'[a-z]+', 'id'),
+            (r'[-+*/]', 'op'),
+            whitespace=' '
+        )
+
+    def tearDown(self) -> None:
+        ...
+
+    def test_lex(self):
+        self.assertEqual(lex('ab + 12*c', self.table), [
+            ('id', 'ab'), ('op', '+'), ('num', 12), ('op', '*'), ('id', 'c')
+        ])
+        self.assertEqual(lex('ab 1', self.table, whitespace=True), [
+            ('id', 'ab'), (None, ' '), ('num', 1)
+        ])
+
+    def test_lex_order(self):
+        table = symbol_table((r'if', 'kw'), (r'[a-z]+', 'id'))
+        self.assertEqual(lex('if', table), [('kw', 'if')])
+        self.assertEqual(lex('iffy', table), [('kw', 'if'), ('id', 'fy')])
+
+    def test_lex_illegal(self):
+        with self.assertRaises(LexError):
+            lex('ab ? c', self.table)
+        with self.assertRaises(LexError):
+            lex('ab c?', self.table)
+
+    def test_lex_plain_list(self):
+        table = [TokenSym(r'(a)\1', 'aa'), TokenSym(r'b', 'b')]
+        self.assertEqual(lex('aab', table), [('aa', 'aa'), ('b', 'b')])
+        table = symbol_table((r'(a)\1', 'aa'), (r'b', 'b'), whitespace=' ')
+        self.assertEqual(lex('aa  b', table, whitespace=True), [('aa', 'aa'), (None, '  '), ('b', 'b')])
+
+    def test_lex_whitespace_symbol(self):
+        # table order wins over the whitespace rule, fused or not
+        for first in (r'(a)\1', r'aa'):
+            table = symbol_table((first, 'aa'), (r'\n', 'nl'), whitespace=' \n')
+            self.assertEqual(lex('aa\n aa', table), [('aa', 'aa'), ('nl', '\n'), ('aa', 'aa')])
@@ -44,4 +44,31 @@ class TestMat(unittest.TestCase):
     def test_shape(self):
         self.assertEqual(self.m_a.shape(), (2, 2))
         self.assertEqual(self.m_b.shape(), (2, 1))
-        self.assertEqual(self.m_b.T.shape(), (1, 2))
\ No newline at end of file
+        self.assertEqual(self.m_b.T.shape(), (1, 2))
+    def test_rows_columns(self):
+        m = Matrix([
+            [1, 2, 3],
+            [4, 5, 6]
+        ])
+        self.assertEqual(list(m.rows()), [[1, 2, 3], [4, 5, 6]])
+        self.assertEqual(list(m.columns()), [[1, 4], [2, 5], [3, 6]])
+        self.assertEqual(m.get_row(1), [4, 5, 6])
+        self.assertEqual(m.get_column(2), [3, 6])
+        self.assertEqual(m.get_row(-1), [4, 5, 6])
+        self.assertEqual(m.get_column(-1), [3, 6])
+        with self.assertRaises(IndexError):
+            m.get_row(2)
+        with self.assertRaises(IndexError):
+            m.get_column(3)
+        with self.assertRaises(IndexError):
+            m.get_column(-4)
+    def test_float(self):
+        m = Matrix([
+            [0.5, 1.5],
+            [2.0, -1.0]
+        ])
+        self.assertEqual(m @ Matrix([[2.0], [4.0]]), Matrix([[7.0], [0.0]]))
+        self.assertEqual(m.T, Matrix([[0.5, 2.0], [1.5, -1.0]]))
+        self.assertEqual(m, Matrix([[0.5, 1.5], [2, -1]]))
+        self.assertEqual(list(m.rows()), [[0.5, 1.5], [2.0, -1.0]])
+        self.assertEqual(m.get_column(1), [1.5, -1.0])
@@ -38,4 +38,8 @@ class TestSigning(unittest.TestCase):
         self.assertEqual(tokp[0], z85decode('0a364:n=hu000000000'))
         self.assertEqual(tokp[1], TIMESTAMP)
 
-        
\ No newline at end of file
+    def test_UserSigner_object(self):
+        signed = self.signer.sign_object({'a': 1, 'b': [2, 3]})
+        self.assertEqual(self.signer.unsign_object(signed), {'a': 1, 'b': [2, 3]})
+        self.assertEqual(len(self.signer.split_signed(signed)), 3)
+
@@ -0,0 +1,25 @@
+
+
+import itertools
+import unittest
+
+from suou.snowflake import SnowflakeGen
+
+
+class TestSnowflake(unittest.TestCase):
+    def setUp(self) -> None:
+        ...
+    def tearDown(self) -> None:
+        ...
+    def test_generation(self):
+        clock = itertools.count()
+        class Gen(SnowflakeGen):
+            # advance one tick every few calls
+            def cur_timestamp(self) -> int:
+                return 1000 + next(clock) // 8
+        gen = Gen(0, local_id=1, shard_id=2)
+        ids = gen.generate_list(3) + gen.generate_list(5000) + [gen.generate_one() for _ in range(5000)]
+        self.assertEqual(len(set(ids)), len(ids))
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual({(i >> 12) & 1023 for i in ids}, {(1 << 5) | 2})
+
@@ -0,0 +1,128 @@
+
+
+import gc
+import os
+import sys
+import tempfile
+import unittest
+
+from sqlalchemy import Column, Integer, LargeBinary, MetaData, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.pool import NullPool
+
+from suou.sqlalchemy import token_signer
+from suou.sqlalchemy.asyncio import SQLAlchemy, SessionWrapper, _engine_kwargs
+from suou.sqlalchemy.quart import AsyncSelectPagination
+
+
+class Base(DeclarativeBase):
+    pass
+
+class Item(Base):
+    __tablename__ = 'item'
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    n: Mapped[int] = mapped_column(Integer)
+
+
+class TestBind(unittest.TestCase):
+    def test_engine_kwargs(self):
+        kw = _engine_kwargs('postgresql+asyncpg://localhost/db', {})
+        self.assertEqual((kw['pool_size'], kw['max_overflow']), (20, 40))
+        self.assertEqual(_engine_kwargs('postgresql+asyncpg://localhost/db', {'pool_size': 5})['pool_size'], 5)
+        kw = _engine_kwargs('postgresql+asyncpg://localhost/db', {'poolclass': NullPool})
+        self.assertNotIn('pool_size', kw)
+        self.assertNotIn('max_overflow', kw)
+        self.assertNotIn('pool_size', _engine_kwargs('sqlite+aiosqlite://', {}))
+
+    def test_bind_sqlite(self):
+        db = SQLAlchemy(Base)
+        db.bind('sqlite+aiosqlite://')
+        self.assertTrue(db.engine.pool._pre_ping)
+        db.bind('sqlite+aiosqlite://', poolclass=NullPool)
+        self.assertIsInstance(db.engine.pool, NullPool)
+
+
+class TestPagination(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = SQLAlchemy(Base, wrap=False)
+        self.db.bind('sqlite+aiosqlite:///' + os.path.join(self.tmpdir.name, 'test.db'))
+        async with self.db.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with self.db as session:
+            session.add_all([Item(n=i % 7) for i in range(23)])
+
+    async def asyncTearDown(self) -> None:
+        await self.db.engine.dispose()
+        self.tmpdir.cleanup()
+
+    async def paginate(self, q, page: int):
+        async with self.db as session:
+            p = AsyncSelectPagination(select=q, session=session, page=page, per_page=10, error_out=None)
+            return [x async for x in p], p.total
+
+    async def test_pages(self):
+        q = select(Item).order_by(Item.id)
+        items, total = await self.paginate(q, 1)
+        self.assertEqual(([x.id for x in items], total), (list(range(1, 11)), 23))
+        items, total = await self.paginate(q, 3)
+        self.assertEqual(([x.id for x in items], total), ([21, 22, 23], 23))
+        # past the end: the total comes from the count query
+        items, total = await self.paginate(q, 9)
+        self.assertEqual((items, total), ([], 23))
+
+    async def test_distinct(self):
+        items, total = await self.paginate(select(Item.n).distinct().order_by(Item.n), 1)
+        self.assertEqual((items, total), (list(range(7)), 7))
+
+
+class TestTokenSigner(unittest.TestCase):
+    def test_column_attr(self):
+        class SignerBase(DeclarativeBase):
+            metadata = MetaData(info={'secret_key': b'k' * 32})
+        class User(SignerBase):
+            __tablename__ = 'user'
+            id = Column(Integer, primary_key=True)
+            secret = Column(LargeBinary)
+            signer = token_signer(id, 'secret')
+        self.assertEqual(User(id=5, secret=b'x' * 16).signer().user_id, 5)
+
+    def test_unnamed_column(self):
+        class SignerBase(DeclarativeBase):
+            pass
+        with self.assertRaises(ValueError):
+            class User(SignerBase):
+                __tablename__ = 'user'
+                id = Column(Integer, primary_key=True)
+                signer = token_signer(Column(Integer), 'id')
+
+
+class TestSessionWrapper(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.db = SQLAlchemy(Base, wrap=False)
+        self.db.bind('sqlite+aiosqlite://')
+        async with self.db.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    async def asyncTearDown(self) -> None:
+        await self.db.engine.dispose()
+
+    async def test_session_ends_with_block(self):
+        w = SessionWrapper(self.db)
+        async with w:
+            w.add(Item(n=1))
+        with self.assertRaises(RuntimeError):
+            w.execute(select(Item))
+        async with self.db as session:
+            self.assertEqual((await session.execute(select(Item.n))).scalars().all(), [1])
+
+    def test_del_not_entered(self):
+        unraisable = []
+        old_hook, sys.unraisablehook = sys.unraisablehook, unraisable.append
+        try:
+            w = SessionWrapper(self.db)
+            del w
+            gc.collect()
+        finally:
+            sys.unraisablehook = old_hook
+        self.assertEqual(unraisable, [])